@@ -32,6 +32,8 @@ class TutorialMakerApp:
 
         # Initialize UI callback system early (needed by web server)
         self.ui_callbacks: List[Callable] = []
+        # Step-count listeners; kept apart because they fire on every captured event
+        self.step_callbacks: List[Callable] = []
         
         # Initialize components
         self.screen_capture = ScreenCapture(debug_mode=debug_mode)
@@ -249,7 +251,8 @@ class TutorialMakerApp:
         
         Args:
             callback: Function that takes (event_type, data) parameters
-                     event_type: 'recording_started', 'recording_stopped', 'recording_paused', 'recording_resumed'
+                     event_type: 'recording_started', 'recording_stopped', 'recording_paused', 'recording_resumed',
+                                 'manual_only_mode_changed'
                      data: Dictionary with relevant state information
         """
         if callback not in self.ui_callbacks:
@@ -278,6 +281,33 @@ class TutorialMakerApp:
             except Exception as e:
                 self.logger.warning(f"UI callback error: {e}")
     
+    def register_step_callback(self, callback: Callable[[int], None]):
+        """
+        Register a callback for step count changes
+        
+        Args:
+            callback: Function that takes the new step count. It is called on the
+                      event listener thread for every captured step, so it must be cheap
+        """
+        if callback not in self.step_callbacks:
+            self.step_callbacks.append(callback)
+    
+    def unregister_step_callback(self, callback: Callable[[int], None]):
+        """Remove a step count callback"""
+        if callback in self.step_callbacks:
+            self.step_callbacks.remove(callback)
+    
+    def _increment_step(self) -> int:
+        """Bump the session step counter and tell step listeners the new count"""
+        step_count = self.session_manager.increment_step_counter()
+        # Only the count is sent; no full session status is built per step
+        for callback in self.step_callbacks:
+            try:
+                callback(step_count)
+            except Exception as e:
+                self.logger.warning(f"Step callback error: {e}")
+        return step_count
+    
     def start_recording(self) -> bool:
         """
         Start recording the current tutorial
@@ -385,7 +415,7 @@ class TutorialMakerApp:
         self.event_queue.add_mouse_click(event, screenshot, coordinate_info)
         
         # Increment step counter for real-time user feedback
-        step_count = self.session_manager.increment_step_counter()
+        step_count = self._increment_step()
         
         # Log to session logger
         if session.logger:
@@ -425,7 +455,7 @@ class TutorialMakerApp:
             should_increment = True
         
         if should_increment:
-            step_count = self.session_manager.increment_step_counter()
+            step_count = self._increment_step()
             if self.debug_mode:
                 self.logger.debug(f"Queued keyboard event '{event.key}' - Step {step_count}")
         else:
@@ -479,7 +509,7 @@ class TutorialMakerApp:
         self.event_queue.add_manual_capture(event, screenshot, coordinate_info)
         
         # Increment step counter for real-time user feedback
-        step_count = self.session_manager.increment_step_counter()
+        step_count = self._increment_step()
         
         # Log to session logger
         if session.logger:
@@ -550,13 +580,22 @@ class TutorialMakerApp:
         """List all available tutorials"""
         return self.storage.list_tutorials()
     
+    def get_tutorial(self, tutorial_id: str) -> Optional[TutorialMetadata]:
+        """Get metadata for a single tutorial"""
+        return self.storage.load_tutorial_metadata(tutorial_id)
+    
     def delete_tutorial(self, tutorial_id: str) -> bool:
         """Delete a tutorial"""
         return self.storage.delete_tutorial(tutorial_id)
     
-    def delete_all_tutorials(self) -> Dict[str, bool]:
-        """Delete all tutorials"""
-        return self.storage.delete_all_tutorials()
+    def delete_tutorials(self, tutorial_ids: List[str],
+                         progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, bool]:
+        """Delete several tutorials at once, optionally reporting (completed, total) progress"""
+        return self.storage.delete_tutorials(tutorial_ids, progress_callback)
+    
+    def delete_all_tutorials(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, bool]:
+        """Delete all tutorials, optionally reporting (completed, total) progress"""
+        return self.storage.delete_all_tutorials(progress_callback)
     
     def get_tutorial_data(self, tutorial_id: str) -> Optional[Dict]:
         """Get complete tutorial data"""
@@ -575,18 +614,20 @@ class TutorialMakerApp:
         """
         return self.exporter.export_tutorial(tutorial_id, formats)
     
-    def export_all_tutorials(self, formats: List[str] = None, max_workers: int = 3) -> Dict[str, Dict[str, str]]:
+    def export_all_tutorials(self, formats: List[str] = None, max_workers: int = 3,
+                             progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict[str, str]]:
         """
         Export all tutorials to specified formats with concurrent processing
         
         Args:
             formats: List of formats to export
             max_workers: Maximum number of concurrent export operations
+            progress_callback: Called as (completed, total) after each tutorial finishes
             
         Returns:
             Dictionary mapping tutorial IDs to export results
         """
-        return self.exporter.export_all_tutorials(formats, max_workers)
+        return self.exporter.export_all_tutorials(formats, max_workers, progress_callback)
     
     def toggle_debug_mode(self) -> bool:
         """Toggle debug mode on/off"""
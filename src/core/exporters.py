@@ -6,7 +6,7 @@ Generates shareable documents from captured tutorial data
 import os
 import json
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable
 from datetime import datetime
 import base64
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -849,13 +849,15 @@ class TutorialExporter:
         
         return results
     
-    def export_all_tutorials(self, formats: List[str] = None, max_workers: int = 3) -> Dict[str, Dict[str, str]]:
+    def export_all_tutorials(self, formats: List[str] = None, max_workers: int = 3,
+                             progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict[str, str]]:
         """
         Export all tutorials to specified formats using concurrent processing
         
         Args:
             formats: List of formats to export
             max_workers: Maximum number of concurrent export operations
+            progress_callback: Called as (completed, total) after each tutorial finishes
             
         Returns:
             Dictionary mapping tutorial IDs to export results
@@ -892,5 +894,8 @@ class TutorialExporter:
                 except Exception as e:
                     print(f"Export task failed for tutorial {tutorial.tutorial_id}: {e}")
                     results[tutorial.tutorial_id] = {"error": str(e)}
+                
+                if progress_callback:
+                    progress_callback(len(results), len(tutorials))
         
         return results
\ No newline at end of file
@@ -9,9 +9,10 @@ import uuid
 import time
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 try:
     from PIL import Image
@@ -39,6 +40,12 @@ class TutorialStep:
     screen_dimensions: Optional[tuple] = None  # (width, height) at time of capture
     step_type: str = "click"  # click, type, special
 
+@lru_cache(maxsize=4096)
+def _format_created(timestamp: float) -> str:
+    """Format a creation timestamp for display; creation times never change, so memoize"""
+    # time.strftime avoids building a datetime object just to format it
+    return time.strftime('%Y-%m-%d %H:%M', time.localtime(timestamp))
+
 @dataclass
 class TutorialMetadata:
     """Metadata for a tutorial project"""
@@ -56,6 +63,18 @@ class TutorialMetadata:
     def __post_init__(self):
         if self.tags is None:
             self.tags = []
+    
+    # Display strings are cached per instance; list_tutorials() only reuses an
+    # instance while its metadata.json is unchanged, so they never go stale
+    @cached_property
+    def duration_str(self) -> str:
+        """Duration in seconds formatted for display"""
+        return f"{self.duration:.1f}"
+    
+    @cached_property
+    def created_str(self) -> str:
+        """Creation time formatted for display"""
+        return _format_created(self.created_at)
 
 class TutorialStorage:
     """Manages storage of tutorial data and projects"""
@@ -73,6 +92,10 @@ class TutorialStorage:
         self.temp_path = self.base_path / "temp"
         self.logger = get_logger('core.storage')
         
+        # metadata.json path -> ((mtime_ns, ctime_ns, inode, size), parsed metadata)
+        # for list_tutorials
+        self._metadata_cache: Dict[Path, tuple] = {}
+        
         self._ensure_directories()
     
     def _ensure_directories(self):
@@ -287,21 +310,43 @@ class TutorialStorage:
             return None
     
     def list_tutorials(self) -> List[TutorialMetadata]:
-        """List all available tutorials"""
+        """List all available tutorials
+        
+        Parsed metadata is cached per metadata.json and reused while the
+        file's mtime, ctime, inode and size are unchanged, so a refresh only
+        stats files and re-reads the ones that were written since the last
+        call. Writes made through this storage drop their cache entry; an
+        external same-size rewrite within one timestamp tick of a coarse
+        filesystem can still be missed until the file changes again.
+        """
         tutorials = []
+        cache = {}
         
         try:
             for project_dir in self.projects_path.iterdir():
-                if project_dir.is_dir():
-                    metadata_file = project_dir / "metadata.json"
-                    if metadata_file.exists():
-                        try:
-                            with open(metadata_file, 'r') as f:
-                                metadata_data = json.load(f)
-                            metadata = TutorialMetadata(**metadata_data)
-                            tutorials.append(metadata)
-                        except Exception as e:
-                            self.logger.warning(f"Error loading metadata for {project_dir}: {e}")
+                metadata_file = project_dir / "metadata.json"
+                try:
+                    stat = metadata_file.stat()
+                except OSError:
+                    continue  # Not a project directory, or no metadata yet
+                
+                file_key = (stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino, stat.st_size)
+                cached = self._metadata_cache.get(metadata_file)
+                if cached is not None and cached[0] == file_key:
+                    metadata = cached[1]
+                else:
+                    try:
+                        with open(metadata_file, 'r') as f:
+                            metadata_data = json.load(f)
+                        metadata = TutorialMetadata(**metadata_data)
+                    except Exception as e:
+                        self.logger.warning(f"Error loading metadata for {project_dir}: {e}")
+                        continue
+                cache[metadata_file] = (file_key, metadata)
+                tutorials.append(metadata)
+            
+            # Entries for deleted tutorials drop out with the old dict
+            self._metadata_cache = cache
             
             # Sort by creation date (newest first)
             tutorials.sort(key=lambda x: x.created_at, reverse=True)
@@ -324,30 +369,63 @@ class TutorialStorage:
             self.logger.error(f"Error deleting tutorial: {e}")
             return False
     
-    def delete_all_tutorials(self) -> Dict[str, bool]:
+    def delete_tutorials(self, tutorial_ids: List[str],
+                         progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, bool]:
         """
-        Delete all tutorials
+        Delete several tutorials in one pass
+        
+        The projects directory is scanned once up front instead of once per
+        tutorial as delete_tutorial() does.
+        
+        Args:
+            tutorial_ids: IDs of the tutorials to delete
+            progress_callback: Called as (completed, total) after each tutorial is processed
         
         Returns:
             Dictionary mapping tutorial IDs to success status
         """
-        tutorials = self.list_tutorials()
         results = {}
         
-        for tutorial in tutorials:
-            try:
-                success = self.delete_tutorial(tutorial.tutorial_id)
-                results[tutorial.tutorial_id] = success
-                if success:
-                    self.logger.info(f"Deleted tutorial: {tutorial.title} ({tutorial.tutorial_id})")
-                else:
-                    self.logger.warning(f"Failed to delete tutorial: {tutorial.title} ({tutorial.tutorial_id})")
-            except Exception as e:
-                self.logger.error(f"Error deleting tutorial {tutorial.tutorial_id}: {e}")
-                results[tutorial.tutorial_id] = False
+        try:
+            project_dirs = [d for d in self.projects_path.iterdir() if d.is_dir()]
+        except Exception as e:
+            self.logger.error(f"Error scanning projects directory: {e}")
+            return {tutorial_id: False for tutorial_id in tutorial_ids}
+        
+        for tutorial_id in tutorial_ids:
+            # Same ID-prefix match as get_project_path()
+            project_path = next((d for d in project_dirs if tutorial_id[:8] in d.name), None)
+            if project_path is None:
+                self.logger.warning(f"Failed to delete tutorial: {tutorial_id} (project not found)")
+                results[tutorial_id] = False
+            else:
+                try:
+                    shutil.rmtree(project_path)
+                    project_dirs.remove(project_path)
+                    results[tutorial_id] = True
+                    self.logger.info(f"Deleted tutorial: {tutorial_id}")
+                except Exception as e:
+                    self.logger.error(f"Error deleting tutorial {tutorial_id}: {e}")
+                    results[tutorial_id] = False
+            
+            if progress_callback:
+                progress_callback(len(results), len(tutorial_ids))
         
         return results
     
+    def delete_all_tutorials(self, progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, bool]:
+        """
+        Delete all tutorials
+        
+        Args:
+            progress_callback: Called as (completed, total) after each tutorial is processed
+        
+        Returns:
+            Dictionary mapping tutorial IDs to success status
+        """
+        tutorial_ids = [tutorial.tutorial_id for tutorial in self.list_tutorials()]
+        return self.delete_tutorials(tutorial_ids, progress_callback)
+    
     def update_tutorial_status(self, tutorial_id: str, status: str) -> bool:
         """Update tutorial status (recording, paused, completed)"""
         metadata = self.load_tutorial_metadata(tutorial_id)
@@ -369,6 +447,8 @@ class TutorialStorage:
             metadata_file = project_path / "metadata.json"
             with open(metadata_file, 'w') as f:
                 json.dump(asdict(metadata), f, indent=2)
+            # The stat key may not move within one timestamp tick
+            self._metadata_cache.pop(metadata_file, None)
             return True
         except Exception as e:
             self.logger.error(f"Error saving metadata: {e}")
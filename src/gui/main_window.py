@@ -3,25 +3,84 @@ Main GUI window for TutorialMaker
 Provides the primary interface for managing tutorials and settings
 """
 
+import sys
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
+from tkinter import ttk, messagebox
 import threading
-import webbrowser
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict
 
 from ..core.app import TutorialMakerApp
-from ..core.session_manager import RecordingSession
+from .recording_controls import RecordingControlWindow
+
+# Display text for the tutorial statuses storage writes; anything else is title-cased on the fly
+STATUS_DISPLAY = {status: status.title() for status in ('recording', 'paused', 'completed')}
+
+
+def _init_styles(style: ttk.Style):
+    """Configure the static ttk theme and styles used by the main window
+    
+    ttk styles belong to a Tk interpreter, so this runs once per root window.
+    """
+    style.theme_use('clam')  # Modern look
+    style.configure('Treeview', font=('Helvetica', 9),
+                    background='white', fieldbackground='white')
+    style.map('Treeview', background=[('selected', '#0078d4')])
+    style.configure('Treeview.Heading', font=('Helvetica', 9, 'bold'),
+                    background='#f0f0f0', relief='flat')
+    # Label styles share one font per style instead of a font spec per widget
+    style.configure('Title.TLabel', font=('Helvetica', 24, 'bold'))
+    style.configure('Version.TLabel', font=('Helvetica', 10), foreground='gray')
+    style.configure('Status.TLabel', font=('Helvetica', 12, 'bold'))
 
 
 class MainWindow:
     """Main application window"""
     
+    # Rows inserted into the tutorial list at a time; further pages are added on scroll
+    TREE_PAGE_SIZE = 100
+    # Quiet period before a requested list refresh actually runs
+    REFRESH_DEBOUNCE_MS = 150
+    
     def __init__(self, app: TutorialMakerApp):
         self.app = app
         self.root = tk.Tk()
-        self.recording_window: Optional['RecordingControlWindow'] = None
+        self.recording_window: Optional[RecordingControlWindow] = None
         self.recording_ui_sync_timer: Optional[str] = None
+        self._is_windows = sys.platform.startswith('win')
+
+        # Dialogs are built on first use and reused afterwards
+        self._export_dialog: Optional[tk.Toplevel] = None
+        self._progress_dialog: Optional[tk.Toplevel] = None
+        self._progress_bar: Optional[ttk.Progressbar] = None
+        self._progress_value = 0
+        self._progress_pump: Optional[str] = None
+
+        # Last rendered Treeview values per tutorial ID (the ID is also the row iid)
+        self._row_cache: Dict[str, tuple] = {}
+        # Loaded rows that are not in the Treeview yet, in display order
+        self._unrendered_rows: list = []
+        self._page_scheduled = False
+        # tutorial_id -> (raw metadata fields, formatted row values)
+        self._format_cache: Dict[str, tuple] = {}
+        # Raw fields of the list the tree was last fully synced to; None after single-row edits
+        self._tutorials_signature: Optional[tuple] = None
+        # Bumped on the Tk thread by every refresh and single-row edit; a refresh
+        # result is applied only if nothing bumped it since its worker started
+        self._refresh_generation = 0
+        # Generation of the most recently started refresh
+        self._latest_refresh = 0
+        # Tutorial ID of the selected row ('' when nothing is selected)
+        self._selected_tid = ''
+        self._pending_refresh: Optional[str] = None
+        # True while a stop is being processed on the worker thread
+        self._stopping = False
+        # True while a bulk action is reading the tutorial list on a worker thread
+        self._bulk_listing = False
+        # Pending after() that hides the recording controls once a stop's stats were shown
+        self._hide_controls_timer: Optional[str] = None
+        # Built on first use and withdrawn, not destroyed, when closed
+        self._settings_dialog = None
 
         self._setup_window()
         self._create_widgets()
@@ -40,33 +99,22 @@ class MainWindow:
         self._set_icon()
         
         # Configure DPI awareness for Windows
-        try:
-            # Try to enable DPI awareness on Windows
-            import sys
-            if sys.platform.startswith('win'):
-                try:
-                    from ctypes import windll
-                    windll.shcore.SetProcessDpiAwareness(1)
-                except:
-                    pass  # Fail silently if not available
-        except:
-            pass
+        if self._is_windows:
+            try:
+                from ctypes import windll
+                windll.shcore.SetProcessDpiAwareness(1)
+            except:
+                pass  # Fail silently if not available
         
         # Configure style
-        self.style = ttk.Style()
-        self.style.theme_use('clam')  # Modern look
+        self.style = ttk.Style(self.root)
+        _init_styles(self.style)
         
         # Configure Treeview row height for better readability
         # This fixes the "squished" appearance on Windows with different DPI settings
         row_height = self._calculate_optimal_row_height()
         self.style.configure('Treeview', rowheight=row_height)
-        self.style.configure('Treeview.Heading', font=('Helvetica', 9, 'bold'))
-        self.style.configure('Treeview', font=('Helvetica', 9))
-        
-        # Add some padding and styling improvements
-        self.style.configure('Treeview', background='white', fieldbackground='white')
-        self.style.map('Treeview', background=[('selected', '#0078d4')])
-        self.style.configure('Treeview.Heading', background='#f0f0f0', relief='flat')
+        self._current_rowheight = row_height
         
         # Configure colors
         self.root.configure(bg='#f8f9fa')
@@ -87,12 +135,10 @@ class MainWindow:
         header_frame = ttk.Frame(main_frame)
         header_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 20))
         
-        title_label = ttk.Label(header_frame, text="TutorialMaker", 
-                               font=('Helvetica', 24, 'bold'))
+        title_label = ttk.Label(header_frame, text="TutorialMaker", style='Title.TLabel')
         title_label.pack(side=tk.LEFT)
         
-        version_label = ttk.Label(header_frame, text="v1.0", 
-                                 font=('Helvetica', 10), foreground='gray')
+        version_label = ttk.Label(header_frame, text="v1.0", style='Version.TLabel')
         version_label.pack(side=tk.RIGHT, pady=(10, 0))
         
         # Control panel
@@ -101,8 +147,11 @@ class MainWindow:
         
         # Recording status
         self.status_var = tk.StringVar(value="Ready to record")
-        status_label = ttk.Label(control_frame, textvariable=self.status_var, 
-                                font=('Helvetica', 12, 'bold'))
+        # Last status text and button states applied by _apply_control_state
+        self._control_state = {'status': "Ready to record", 'new': 'normal',
+                               'start': 'disabled', 'stop': 'disabled'}
+        status_label = ttk.Label(control_frame, textvariable=self.status_var,
+                                style='Status.TLabel')
         status_label.grid(row=0, column=0, columnspan=3, pady=(0, 10))
         
         # Tutorial name entry
@@ -165,29 +214,33 @@ class MainWindow:
         list_frame.rowconfigure(0, weight=1)
         
         # Treeview for tutorials
-        columns = ('Name', 'Steps', 'Duration', 'Created', 'Status')
+        # (key, heading, width, minwidth, anchor, stretch) - minimum widths keep scaling sane
+        column_specs = (
+            ('Name', 'Tutorial Name', 280, 200, 'w', True),
+            ('Steps', 'Steps', 80, 60, 'center', False),
+            ('Duration', 'Duration (s)', 110, 90, 'center', False),
+            ('Created', 'Created', 160, 120, 'w', False),
+            ('Status', 'Status', 100, 80, 'center', False),
+        )
+        columns = tuple(spec[0] for spec in column_specs)
         self.tutorial_tree = ttk.Treeview(list_frame, columns=columns, show='headings', height=10)
         
-        # Configure columns with better spacing and minimum widths
-        self.tutorial_tree.heading('Name', text='Tutorial Name')
-        self.tutorial_tree.heading('Steps', text='Steps')
-        self.tutorial_tree.heading('Duration', text='Duration (s)')
-        self.tutorial_tree.heading('Created', text='Created')
-        self.tutorial_tree.heading('Status', text='Status')
-        
-        # Set column properties with minimum widths for better scaling
-        self.tutorial_tree.column('Name', width=280, minwidth=200, stretch=True)
-        self.tutorial_tree.column('Steps', width=80, minwidth=60, anchor='center', stretch=False)
-        self.tutorial_tree.column('Duration', width=110, minwidth=90, anchor='center', stretch=False)
-        self.tutorial_tree.column('Created', width=160, minwidth=120, stretch=False)
-        self.tutorial_tree.column('Status', width=100, minwidth=80, anchor='center', stretch=False)
+        # Configure every heading and column in one Tcl script instead of ten round trips
+        tree_path = str(self.tutorial_tree)
+        commands = []
+        for key, heading, width, minwidth, anchor, stretch in column_specs:
+            commands.append(f"{tree_path} heading {key} -text {{{heading}}}")
+            commands.append(f"{tree_path} column {key} -width {width} -minwidth {minwidth} "
+                            f"-anchor {anchor} -stretch {int(stretch)}")
+        self.tutorial_tree.tk.eval("\n".join(commands))
         
         # Scrollbar for treeview
-        scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=self.tutorial_tree.yview)
-        self.tutorial_tree.configure(yscrollcommand=scrollbar.set)
+        self.tutorial_scrollbar = ttk.Scrollbar(list_frame, orient='vertical',
+                                                command=self.tutorial_tree.yview)
+        self.tutorial_tree.configure(yscrollcommand=self._on_tree_scroll)
         
         self.tutorial_tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tutorial_scrollbar.grid(row=0, column=1, sticky="ns")
         
         # Context menu for tutorials
         self.context_menu = tk.Menu(self.root, tearoff=0)
@@ -201,7 +254,7 @@ class MainWindow:
         toolbar_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(20, 0))
         
         ttk.Button(toolbar_frame, text="Refresh List", 
-                  command=self._refresh_tutorials).pack(side=tk.LEFT)
+                  command=self._schedule_refresh).pack(side=tk.LEFT)
         
         ttk.Button(toolbar_frame, text="Export All", 
                   command=self._export_all_tutorials).pack(side=tk.LEFT, padx=(10, 0))
@@ -216,7 +269,7 @@ class MainWindow:
                   command=self._open_settings).pack(side=tk.RIGHT)
         
         # Load initial data
-        self._refresh_tutorials()
+        self._schedule_refresh()
     
     def _calculate_optimal_row_height(self):
         """Calculate optimal row height based on system DPI and font size"""
@@ -235,11 +288,9 @@ class MainWindow:
             row_height = max(25, font_height + 10)
             
             # On Windows with high DPI, might need extra height
-            import sys
-            if sys.platform.startswith('win'):
+            if self._is_windows:
                 try:
                     # Try to detect DPI scaling
-                    import tkinter.font as tkfont
                     default_font = tkfont.nametofont("TkDefaultFont")
                     font_size = default_font['size']
                     if font_size > 9:  # Likely high DPI
@@ -258,18 +309,24 @@ class MainWindow:
         # Only respond to root window events, not child widgets
         if event.widget == self.root:
             # Check if we need to adjust row height due to DPI changes
-            current_height = self.style.lookup('Treeview', 'rowheight')
+            current_height = self._current_rowheight
             optimal_height = self._calculate_optimal_row_height()
             
             # Only update if there's a significant difference
-            if abs(int(current_height or 25) - optimal_height) > 3:
+            if abs(current_height - optimal_height) > 3:
                 self.style.configure('Treeview', rowheight=optimal_height)
+                self._current_rowheight = optimal_height
         
     def _setup_bindings(self):
         """Set up event bindings"""
-        # Context menu for tutorial list
-        self.tutorial_tree.bind("<Button-2>", self._show_context_menu)  # Right click on macOS
-        self.tutorial_tree.bind("<Button-3>", self._show_context_menu)  # Right click on Windows/Linux
+        # Context menu for tutorial list. Button-2 is the middle button on X11 and
+        # Windows, so it only opens the menu on macOS (Button-3 there in newer Tk)
+        self.tutorial_tree.bind("<Button-3>", self._on_right_click)
+        if self.root.tk.call('tk', 'windowingsystem') == 'aqua':
+            self.tutorial_tree.bind("<Button-2>", self._on_right_click)
+        
+        # Track the selected tutorial so actions don't have to query the tree
+        self.tutorial_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         
         # Double click to edit
         self.tutorial_tree.bind("<Double-1>", lambda e: self._edit_tutorial())
@@ -289,10 +346,8 @@ class MainWindow:
             
         try:
             tutorial_id = self.app.new_tutorial(name, use_gui_selector=True)
-            self.status_var.set(f"Created: {name}")
-            self.start_btn.config(state='normal')
-            self.new_btn.config(state='disabled')
-            self._refresh_tutorials()
+            self._apply_control_state(status=f"Created: {name}", new='disabled', start='normal')
+            self._update_tutorial_row(tutorial_id)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create tutorial: {e}")
     
@@ -308,10 +363,8 @@ class MainWindow:
                         session.manual_only_mode = True
                         print("Manual-only mode enabled for this recording")
 
-                self.status_var.set("🔴 Recording...")
-                self.start_btn.config(state='disabled')
-                self.stop_btn.config(state='normal')
-                self.new_btn.config(state='disabled')
+                self._apply_control_state(status="🔴 Recording...", new='disabled',
+                                          start='disabled', stop='normal')
 
                 # Start periodic UI sync during recording
                 self._start_recording_ui_sync()
@@ -324,41 +377,87 @@ class MainWindow:
             messagebox.showerror("Error", f"Failed to start recording: {e}")
     
     def _stop_recording(self):
-        """Stop recording and finalize tutorial"""
+        """Stop recording and finalize tutorial
+        
+        Finalizing processes every queued event into a step (screenshots,
+        OCR), so it runs on a worker thread and reports back to _on_recording_stopped.
+        """
+        if self._stopping:
+            return
         try:
             # Get recording stats before stopping (so we can show them)
             current_status = self.app.get_current_session_status()
             final_step_count = current_status.get('step_count', 0)
             tutorial_name = current_status.get('title', 'Unknown')
-            
-            tutorial_id = self.app.stop_recording()
-            if tutorial_id:
-                self.status_var.set(f"✅ Recording completed: {final_step_count} steps captured")
-                self._reset_controls()
-                self._refresh_tutorials()
-                
-                # Show final stats in recording controls before hiding
-                if self.recording_window:
-                    self.recording_window.show_completion_stats(final_step_count, tutorial_name)
-                    # Delay hiding the window so user can see final stats
-                    self.root.after(3000, self.recording_window.hide)  # Hide after 3 seconds
-                    
-                # Ask if user wants to edit
-                if messagebox.askyesno("Recording Complete", 
-                                     f"Tutorial '{tutorial_name}' recorded successfully!\n"
-                                     f"Captured {final_step_count} steps.\n\n"
-                                     "Would you like to edit it in the web browser?"):
-                    self._open_tutorial_in_browser(tutorial_id)
-            else:
-                messagebox.showerror("Error", "Failed to stop recording")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to stop recording: {e}")
+            return
+        
+        self._stopping = True
+        self._apply_control_state(status="Processing recording...", stop='disabled')
+        threading.Thread(target=self._stop_recording_worker,
+                         args=(final_step_count, tutorial_name), daemon=True).start()
+    
+    def _stop_recording_worker(self, final_step_count: int, tutorial_name: str):
+        """Stop the recording off the Tk thread and post the outcome back to it"""
+        try:
+            tutorial_id = self.app.stop_recording()
+        except Exception as e:
+            self.root.after(0, self._on_recording_stopped, None, final_step_count, tutorial_name, e)
+            return
+        self.root.after(0, self._on_recording_stopped, tutorial_id, final_step_count, tutorial_name, None)
+    
+    def _on_recording_stopped(self, tutorial_id: Optional[str], final_step_count: int,
+                              tutorial_name: str, error: Optional[Exception]):
+        """Update the UI once a stop has finished processing"""
+        self._stopping = False
+        if error is not None:
+            self._apply_control_state(stop='normal')
+            messagebox.showerror("Error", f"Failed to stop recording: {error}")
+            return
+        if not tutorial_id:
+            self._apply_control_state(stop='normal')
+            messagebox.showerror("Error", "Failed to stop recording")
+            return
+        
+        self._apply_control_state(status=f"✅ Recording completed: {final_step_count} steps captured")
+        self._reset_controls()
+        self._update_tutorial_row(tutorial_id)
+        
+        # Show final stats in recording controls before hiding
+        if self.recording_window:
+            self.recording_window.show_completion_stats(final_step_count, tutorial_name)
+            # Delay hiding the window so user can see final stats
+            self._schedule_hide_recording_controls()
+            
+        # Ask if user wants to edit
+        if messagebox.askyesno("Recording Complete", 
+                             f"Tutorial '{tutorial_name}' recorded successfully!\n"
+                             f"Captured {final_step_count} steps.\n\n"
+                             "Would you like to edit it in the web browser?"):
+            self._open_tutorial_in_browser(tutorial_id)
+    
+    def _apply_control_state(self, status: Optional[str] = None, new: Optional[str] = None,
+                             start: Optional[str] = None, stop: Optional[str] = None):
+        """Update the status text and recording button states in one place
+        
+        Only values that differ from what was last applied reach Tk; None
+        leaves that control untouched.
+        """
+        if status is not None and status != self._control_state.get('status'):
+            self.status_var.set(status)
+            self._control_state['status'] = status
+        
+        for key, button, state in (('new', self.new_btn, new),
+                                   ('start', self.start_btn, start),
+                                   ('stop', self.stop_btn, stop)):
+            if state is not None and state != self._control_state.get(key):
+                button.config(state=state)
+                self._control_state[key] = state
     
     def _reset_controls(self):
         """Reset controls to initial state"""
-        self.start_btn.config(state='disabled')
-        self.stop_btn.config(state='disabled')
-        self.new_btn.config(state='normal')
+        self._apply_control_state(new='normal', start='disabled', stop='disabled')
         self.tutorial_name_var.set("")
 
         # Stop UI sync timer
@@ -450,244 +549,570 @@ class MainWindow:
             self.root.after_cancel(self.recording_ui_sync_timer)
             self.recording_ui_sync_timer = None
 
+    def _schedule_hide_recording_controls(self):
+        """Hide the recording controls in 3 seconds, replacing any earlier request"""
+        self._cancel_hide_recording_controls()
+        self._hide_controls_timer = self.root.after(3000, self._hide_recording_controls)
+    
+    def _cancel_hide_recording_controls(self):
+        """Drop a pending delayed hide of the recording controls"""
+        if self._hide_controls_timer is not None:
+            self.root.after_cancel(self._hide_controls_timer)
+            self._hide_controls_timer = None
+    
+    def _hide_recording_controls(self):
+        """Delayed hide of the recording controls"""
+        self._hide_controls_timer = None
+        if self.recording_window and self.recording_window.window:
+            self.recording_window.hide()
+    
     def _show_recording_controls(self):
         """Show floating recording control window"""
+        # A new recording must not be hidden by the previous stop's timer
+        self._cancel_hide_recording_controls()
         try:
             if not self.recording_window:
-                from .recording_controls import RecordingControlWindow
                 self.recording_window = RecordingControlWindow(self.app, self)
             self.recording_window.show()
         except Exception as e:
             print(f"Warning: Could not show floating controls: {e}")
             print("Recording will continue normally, controls available in main window.")
     
+    def _schedule_refresh(self):
+        """Request a tutorials list refresh
+        
+        Trailing debounce: each request restarts the timer, so a burst of
+        mutations (stop then new, several deletes) reloads the list once.
+        """
+        if self._pending_refresh is not None:
+            self.root.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.root.after(self.REFRESH_DEBOUNCE_MS, self._do_refresh)
+    
+    def _do_refresh(self):
+        """Run a scheduled refresh"""
+        self._pending_refresh = None
+        self._refresh_tutorials()
+    
     def _refresh_tutorials(self):
-        """Refresh the tutorials list"""
-        # Clear existing items
-        for item in self.tutorial_tree.get_children():
-            self.tutorial_tree.delete(item)
-        
-        # Load tutorials
+        """Refresh the tutorials list
+        
+        Storage is read on a background thread; the Treeview itself is only
+        touched from the Tk thread in _apply_tutorial_rows.
+        """
+        self._refresh_generation += 1
+        self._latest_refresh = self._refresh_generation
+        threading.Thread(target=self._load_tutorials_worker,
+                         args=(self._refresh_generation,), daemon=True).start()
+    
+    def _load_tutorials_worker(self, generation: int):
+        """Read tutorial metadata off the Tk thread; formatting happens in _apply_tutorial_rows"""
         try:
             tutorials = self.app.list_tutorials()
-            for tutorial in tutorials:
-                created_date = datetime.fromtimestamp(tutorial.created_at).strftime('%Y-%m-%d %H:%M')
-                self.tutorial_tree.insert('', 'end', values=(
-                    tutorial.title,
-                    tutorial.step_count,
-                    f"{tutorial.duration:.1f}",
-                    created_date,
-                    tutorial.status.title()
-                ), tags=(tutorial.tutorial_id,))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to load tutorials: {e}")
+            self.root.after(0, lambda error=e: messagebox.showerror(
+                "Error", f"Failed to load tutorials: {error}"))
+            return
+        
+        self.root.after(0, self._apply_tutorial_rows, tutorials, generation)
+    
+    def _apply_tutorial_rows(self, tutorials, generation: int):
+        """Bring the Treeview in line with freshly loaded tutorial metadata
+        
+        Results older than the latest refresh or single-row edit are dropped,
+        so a slow worker never puts stale values back. Rows are formatted here
+        on the Tk thread, which owns _format_cache. Only rows that were added,
+        removed or changed since the last render are touched; unchanged rows
+        cost no Tk calls. At most one page beyond what is already shown is
+        inserted; the rest wait for the user to scroll.
+        """
+        if generation != self._refresh_generation:
+            if generation == self._latest_refresh:
+                # Only a single-row edit overtook this read; load again after it
+                self._schedule_refresh()
+            return
+        
+        # Skip formatting and diffing entirely when nothing changed since the last sync
+        signature = tuple((t.tutorial_id, t.title, t.step_count, t.duration,
+                           t.created_at, t.status) for t in tutorials)
+        if signature == self._tutorials_signature:
+            return
+        
+        rows = [(tutorial.tutorial_id, self._tutorial_row_values(tutorial))
+                for tutorial in tutorials]
+        # Forget formatting for tutorials that no longer exist
+        live_ids = {tutorial_id for tutorial_id, _ in rows}
+        for tutorial_id in list(self._format_cache):
+            if tutorial_id not in live_ids:
+                del self._format_cache[tutorial_id]
+        
+        limit = max(self.TREE_PAGE_SIZE, len(self._row_cache))
+        visible_rows = rows[:limit]
+        self._unrendered_rows = rows[limit:]
+        new_ids = {tutorial_id for tutorial_id, _ in visible_rows}
+        
+        # Remove rows for tutorials that no longer exist in a single call
+        removed = [tid for tid in self._row_cache if tid not in new_ids]
+        if removed:
+            self.tutorial_tree.delete(*removed)
+            for tutorial_id in removed:
+                del self._row_cache[tutorial_id]
+            if self._selected_tid in removed:
+                self._selected_tid = ''
+        
+        self._insert_rows(visible_rows, 0)
+        self._tutorials_signature = signature
+    
+    def _insert_rows(self, rows, start_index: int):
+        """Insert or update rows at consecutive positions starting at start_index"""
+        # Call the Treeview's Tcl command directly; the ttk wrappers rebuild and
+        # validate option dicts on every call, which adds up over many rows
+        tk_call = self.tutorial_tree.tk.call
+        tree_path = str(self.tutorial_tree)
+        
+        # Detach the scrollbar while inserting so it is updated once, not per row
+        self.tutorial_tree.configure(yscrollcommand='')
+        try:
+            for index, (tutorial_id, values) in enumerate(rows, start_index):
+                cached = self._row_cache.get(tutorial_id)
+                if cached is None:
+                    tk_call(tree_path, 'insert', '', index, '-id', tutorial_id, '-values', values)
+                elif cached != values:
+                    tk_call(tree_path, 'item', tutorial_id, '-values', values)
+                else:
+                    continue
+                self._row_cache[tutorial_id] = values
+        finally:
+            self.tutorial_tree.configure(yscrollcommand=self._on_tree_scroll)
+    
+    def _on_tree_scroll(self, first, last):
+        """Forward Treeview scrolling to the scrollbar and load more rows near the end"""
+        self.tutorial_scrollbar.set(first, last)
+        if self._unrendered_rows and float(last) > 0.9 and not self._page_scheduled:
+            # Insert outside of the scroll callback to avoid re-entering it
+            self._page_scheduled = True
+            self.root.after_idle(self._render_next_page)
+    
+    def _render_next_page(self):
+        """Append the next page of loaded rows to the Treeview"""
+        self._page_scheduled = False
+        page = self._unrendered_rows[:self.TREE_PAGE_SIZE]
+        self._unrendered_rows = self._unrendered_rows[self.TREE_PAGE_SIZE:]
+        self._insert_rows(page, len(self._row_cache))
+    
+    def _tutorial_row_values(self, tutorial) -> tuple:
+        """Format a tutorial's metadata as Treeview column values
+        
+        Formatted values are memoized per tutorial on the raw fields they are
+        built from, so unchanged tutorials skip formatting on every refresh.
+        """
+        raw = (tutorial.title, tutorial.step_count, tutorial.duration,
+               tutorial.created_at, tutorial.status)
+        cached = self._format_cache.get(tutorial.tutorial_id)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        
+        values = (
+            tutorial.title,
+            tutorial.step_count,
+            tutorial.duration_str,
+            tutorial.created_str,
+            STATUS_DISPLAY.get(tutorial.status) or tutorial.status.title()
+        )
+        self._format_cache[tutorial.tutorial_id] = (raw, values)
+        return values
+    
+    def _add_tutorial_row(self, tutorial, index=0):
+        """Insert a single tutorial row (newest first by default)"""
+        self._refresh_generation += 1
+        self._tutorials_signature = None
+        values = self._tutorial_row_values(tutorial)
+        # Tutorial IDs are unique, so they double as the row iid
+        self.tutorial_tree.insert('', index, iid=tutorial.tutorial_id, values=values)
+        self._row_cache[tutorial.tutorial_id] = values
+    
+    def _update_tutorial_row(self, tutorial_id: str):
+        """Re-read one tutorial and update (or add) only its row"""
+        self._refresh_generation += 1
+        self._tutorials_signature = None
+        tutorial = self.app.get_tutorial(tutorial_id)
+        if tutorial is None:
+            self._remove_tutorial_row(tutorial_id)
+        elif tutorial_id in self._row_cache:
+            values = self._tutorial_row_values(tutorial)
+            if self._row_cache[tutorial_id] != values:
+                self.tutorial_tree.item(tutorial_id, values=values)
+                self._row_cache[tutorial_id] = values
+        else:
+            # A row that has not been scrolled into view yet is updated in place
+            values = self._tutorial_row_values(tutorial)
+            for index, (row_id, _) in enumerate(self._unrendered_rows):
+                if row_id == tutorial_id:
+                    self._unrendered_rows[index] = (tutorial_id, values)
+                    return
+            self._add_tutorial_row(tutorial)
     
-    def _show_context_menu(self, event):
-        """Show context menu for tutorial list"""
-        item = self.tutorial_tree.selection()[0] if self.tutorial_tree.selection() else None
+    def _remove_tutorial_row(self, tutorial_id: str):
+        """Remove a single tutorial row if it is present"""
+        self._refresh_generation += 1
+        self._tutorials_signature = None
+        if self._row_cache.pop(tutorial_id, None) is not None:
+            self.tutorial_tree.delete(tutorial_id)
+            if self._selected_tid == tutorial_id:
+                self._selected_tid = ''
+        else:
+            self._unrendered_rows = [row for row in self._unrendered_rows if row[0] != tutorial_id]
+    
+    def _on_right_click(self, event):
+        """Select the row under the pointer and show the context menu for it"""
+        item = self.tutorial_tree.identify_row(event.y)
         if item:
-            self.context_menu.post(event.x_root, event.y_root)
+            self.tutorial_tree.selection_set(item)
+            self.tutorial_tree.focus(item)
+            self._selected_tid = item
+            self.context_menu.tk_popup(event.x_root, event.y_root)
+    
+    def _on_tree_select(self, event):
+        """Remember the selected tutorial ID (row iids are tutorial IDs)"""
+        selection = self.tutorial_tree.selection()
+        self._selected_tid = selection[0] if selection else ''
     
     def _edit_tutorial(self):
         """Edit selected tutorial in browser"""
-        selection = self.tutorial_tree.selection()
-        if not selection:
+        tutorial_id = self._selected_tid
+        if not tutorial_id:
             messagebox.showwarning("No Selection", "Please select a tutorial to edit")
             return
         
-        item = selection[0]
-        tutorial_id = self.tutorial_tree.item(item, 'tags')[0]
         self._open_tutorial_in_browser(tutorial_id)
     
     def _export_tutorial(self):
         """Export selected tutorial"""
-        selection = self.tutorial_tree.selection()
-        if not selection:
+        tutorial_id = self._selected_tid
+        if not tutorial_id:
             messagebox.showwarning("No Selection", "Please select a tutorial to export")
             return
         
-        item = selection[0]
-        tutorial_id = self.tutorial_tree.item(item, 'tags')[0]
-        
+        self._show_progress("Exporting...", "Exporting tutorial to HTML, WORD, PDF...")
+        threading.Thread(target=self._export_worker, args=(tutorial_id,), daemon=True).start()
+    
+    def _export_worker(self, tutorial_id: str):
+        """Export one tutorial off the Tk thread and post the outcome back to it"""
         try:
             results = self.app.export_tutorial(tutorial_id, ['html', 'word', 'pdf'])
-            message = "Tutorial exported successfully:\\n"
-            for format_name, path in results.items():
-                if path and not path.startswith('Error:'):
-                    message += f"• {format_name.upper()}: {path}\\n"
-            messagebox.showinfo("Export Complete", message)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to export tutorial: {e}")
+            self.root.after(0, self._on_export_done, None, e)
+            return
+        self.root.after(0, self._on_export_done, results, None)
+    
+    def _on_export_done(self, results: Optional[Dict[str, str]], error: Optional[Exception]):
+        """Report the result of a single-tutorial export"""
+        self._hide_progress()
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to export tutorial: {error}")
+            return
+        
+        lines = ["Tutorial exported successfully:"]
+        lines.extend(f"- {format_name.upper()}: {path}" for format_name, path in results.items()
+                     if path and not path.startswith('Error:'))
+        messagebox.showinfo("Export Complete", "\n".join(lines))
     
     def _delete_tutorial(self):
         """Delete selected tutorial"""
-        selection = self.tutorial_tree.selection()
-        if not selection:
+        tutorial_id = self._selected_tid
+        if not tutorial_id:
             messagebox.showwarning("No Selection", "Please select a tutorial to delete")
             return
         
-        item = selection[0]
-        tutorial_id = self.tutorial_tree.item(item, 'tags')[0]
-        tutorial_name = self.tutorial_tree.item(item, 'values')[0]
+        tutorial_name = self.tutorial_tree.item(tutorial_id, 'values')[0]
         
         if messagebox.askyesno("Confirm Delete", 
                               f"Are you sure you want to delete '{tutorial_name}'?\\n\\n"
                               "This action cannot be undone."):
-            try:
-                success = self.app.delete_tutorial(tutorial_id)
-                if success:
-                    self._refresh_tutorials()
-                    messagebox.showinfo("Success", "Tutorial deleted successfully")
-                else:
-                    messagebox.showerror("Error", "Failed to delete tutorial")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete tutorial: {e}")
+            threading.Thread(target=self._delete_worker, args=(tutorial_id,), daemon=True).start()
     
-    def _open_web_editor(self):
-        """Open web editor in browser"""
+    def _delete_worker(self, tutorial_id: str):
+        """Delete one tutorial off the Tk thread and post the outcome back to it"""
         try:
-            url = self.app.start_web_server()
-            if url:
-                webbrowser.open(url)
-            else:
-                messagebox.showerror("Error", "Failed to start web server")
+            success = self.app.delete_tutorial(tutorial_id)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open web editor: {e}")
+            self.root.after(0, self._on_delete_done, tutorial_id, False, e)
+            return
+        self.root.after(0, self._on_delete_done, tutorial_id, success, None)
+    
+    def _on_delete_done(self, tutorial_id: str, success: bool, error: Optional[Exception]):
+        """Report the result of a single-tutorial delete"""
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to delete tutorial: {error}")
+        elif success:
+            self._remove_tutorial_row(tutorial_id)
+            messagebox.showinfo("Success", "Tutorial deleted successfully")
+        else:
+            messagebox.showerror("Error", "Failed to delete tutorial")
+    
+    def _open_web_editor(self):
+        """Open web editor in browser"""
+        self._open_in_browser('')
     
     def _open_tutorial_in_browser(self, tutorial_id: str):
         """Open specific tutorial in browser"""
+        self._open_in_browser(f"/tutorial/{tutorial_id}")
+    
+    def _open_in_browser(self, path: str):
+        """Start the web server if needed and open path on it
+        
+        The first start waits for the server to come up, so it runs on a
+        worker thread instead of freezing the window.
+        """
+        threading.Thread(target=self._web_worker, args=(path,), daemon=True).start()
+    
+    def _web_worker(self, path: str):
+        """Start the web server and open the browser off the Tk thread"""
         try:
             url = self.app.start_web_server()
             if url:
-                tutorial_url = f"{url}/tutorial/{tutorial_id}"
-                webbrowser.open(tutorial_url)
+                import webbrowser  # Deferred: pulls in subprocess/shlex, only needed here
+                webbrowser.open(f"{url}{path}")
+                return
+            error = "Failed to start web server"
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to open tutorial: {e}")
+            error = f"Failed to open web editor: {e}"
+        self.root.after(0, lambda: messagebox.showerror("Error", error))
     
     def _open_settings(self):
         """Open settings dialog"""
         try:
-            from .settings_dialog import SettingsDialog
-            dialog = SettingsDialog(self.root, self.app)
-            dialog.show()
+            if self._settings_dialog is None:
+                from .settings_dialog import SettingsDialog
+                self._settings_dialog = SettingsDialog(self.root, self.app)
+            self._settings_dialog.show()
         except Exception as e:
             print(f"Warning: Could not open settings: {e}")
             messagebox.showwarning("Settings", "Settings dialog not available in this version.")
     
-    def _export_all_tutorials(self):
-        """Export all tutorials to multiple formats"""
-        tutorials = self.app.list_tutorials()
-        
-        if not tutorials:
-            messagebox.showinfo("No Tutorials", "No tutorials found to export.")
-            return
-        
-        # Show format selection dialog
-        from tkinter import simpledialog
+    def _place_dialog(self, dialog: tk.Toplevel):
+        """Center a dialog over the main window and show it
         
-        format_dialog = tk.Toplevel(self.root)
-        format_dialog.title("Export All Tutorials")
-        format_dialog.geometry("400x300")
-        format_dialog.transient(self.root)
-        format_dialog.grab_set()
-        
-        # Center the dialog
-        format_dialog.update_idletasks()
-        x = (format_dialog.winfo_screenwidth() // 2) - (400 // 2)
-        y = (format_dialog.winfo_screenheight() // 2) - (300 // 2)
-        format_dialog.geometry(f"400x300+{x}+{y}")
+        Uses Tk's own tk::PlaceWindow, which falls back to centering on the
+        screen when the main window is hidden and keeps the dialog on-screen.
+        """
+        self.root.tk.call('tk::PlaceWindow', str(dialog), 'widget', str(self.root))
+    
+    def _build_export_dialog(self):
+        """Build the Export All format dialog once; it is hidden between uses"""
+        dialog = tk.Toplevel(self.root, width=400, height=300)
+        dialog.withdraw()
+        dialog.title("Export All Tutorials")
+        dialog.transient(self.root)
+        dialog.pack_propagate(False)  # Keep the fixed size regardless of content
         
         # Dialog content
-        tk.Label(format_dialog, text=f"Export {len(tutorials)} tutorial(s) to:", 
+        self._export_heading_var = tk.StringVar()
+        tk.Label(dialog, textvariable=self._export_heading_var, 
                 font=('Arial', 12, 'bold')).pack(pady=20)
         
         # Format checkboxes
-        format_vars = {}
+        self._export_format_vars = {}
         formats = [('HTML', 'html'), ('Word Document', 'word'), ('PDF', 'pdf'), ('Markdown', 'markdown')]
         
         for display_name, format_key in formats:
-            var = tk.BooleanVar(value=format_key in ['html', 'word'])  # Default to HTML and Word
-            format_vars[format_key] = var
-            tk.Checkbutton(format_dialog, text=display_name, variable=var, 
+            var = tk.BooleanVar()
+            self._export_format_vars[format_key] = var
+            tk.Checkbutton(dialog, text=display_name, variable=var, 
                           font=('Arial', 10)).pack(pady=5)
         
         # Buttons
-        button_frame = tk.Frame(format_dialog)
+        button_frame = tk.Frame(dialog)
         button_frame.pack(pady=20)
         
-        result = {'cancelled': True}
+        # Set to 'export' or 'cancel' when the user closes the dialog
+        self._export_dialog_result = tk.StringVar()
         
         def on_export():
-            selected_formats = [k for k, v in format_vars.items() if v.get()]
-            if not selected_formats:
-                messagebox.showerror("No Formats", "Please select at least one export format.")
+            if not any(v.get() for v in self._export_format_vars.values()):
+                messagebox.showerror("No Formats", "Please select at least one export format.",
+                                     parent=dialog)
                 return
-            result['formats'] = selected_formats
-            result['cancelled'] = False
-            format_dialog.destroy()
+            self._export_dialog_result.set('export')
         
         def on_cancel():
-            format_dialog.destroy()
+            self._export_dialog_result.set('cancel')
         
         tk.Button(button_frame, text="Export", command=on_export, bg='#28a745', 
                  fg='white', padx=20, pady=5).pack(side=tk.LEFT, padx=10)
         tk.Button(button_frame, text="Cancel", command=on_cancel, padx=20, pady=5).pack(side=tk.LEFT)
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+        
+        self._export_dialog = dialog
+    
+    def _build_progress_dialog(self):
+        """Build the shared progress dialog once; it is hidden between uses"""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        dialog.pack_propagate(False)  # Sized per operation in _show_progress
+        # Progress dialogs are closed by the operation, not by the user
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        self._progress_message_var = tk.StringVar()
+        tk.Label(dialog, textvariable=self._progress_message_var, 
+                font=('Arial', 10)).pack(pady=(20, 0))
+        
+        # Tk animates the bar natively, so no redraw calls are needed while it runs
+        self._progress_bar = ttk.Progressbar(dialog, length=300)
+        self._progress_bar.pack(pady=20)
+        
+        self._progress_dialog = dialog
+    
+    def _show_progress(self, title: str, message: str, maximum: Optional[int] = None,
+                       width: int = 350, height: int = 150):
+        """Show the shared progress dialog
+        
+        With a maximum the bar is determinate: worker threads post the latest
+        count with _report_progress and the Tk thread samples it every 50 ms.
+        Without one the bar animates in indeterminate mode.
+        """
+        if self._progress_dialog is None:
+            self._build_progress_dialog()
+        
+        dialog = self._progress_dialog
+        dialog.title(title)
+        self._progress_message_var.set(message)
+        
+        if maximum:
+            self._progress_bar.configure(mode='determinate', maximum=maximum, value=0)
+            self._progress_value = 0
+            self._progress_pump = self.root.after(50, self._pump_progress_ui)
+        else:
+            self._progress_bar.configure(mode='indeterminate', value=0)
+            self._progress_bar.start(50)
+        
+        dialog.configure(width=width, height=height)
+        self._place_dialog(dialog)
+        dialog.grab_set()
+    
+    def _set_progress(self, value: int):
+        """Advance a determinate progress bar"""
+        if self._progress_bar is not None:
+            self._progress_bar.configure(value=value)
+    
+    def _report_progress(self, value: int):
+        """Record the latest progress count; safe to call from any thread"""
+        self._progress_value = value
+    
+    def _pump_progress_ui(self):
+        """Apply the latest reported progress and check again in 50 ms"""
+        self._set_progress(self._progress_value)
+        self._progress_pump = self.root.after(50, self._pump_progress_ui)
+    
+    def _hide_progress(self):
+        """Hide the shared progress dialog"""
+        if self._progress_pump is not None:
+            self.root.after_cancel(self._progress_pump)
+            self._progress_pump = None
+        if self._progress_dialog is not None:
+            self._progress_bar.stop()
+            self._progress_dialog.grab_release()
+            self._progress_dialog.withdraw()
+    
+    def _list_tutorials_then(self, callback):
+        """Read the tutorial list off the Tk thread, then call callback(tutorials) on it"""
+        if self._bulk_listing:
+            return  # A bulk action is already waiting for its list
+        self._bulk_listing = True
+        
+        def on_loaded(tutorials):
+            self._bulk_listing = False
+            callback(tutorials)
+        
+        def on_error(error):
+            self._bulk_listing = False
+            messagebox.showerror("Error", f"Failed to load tutorials: {error}")
+        
+        def list_thread():
+            try:
+                tutorials = self.app.list_tutorials()
+            except Exception as e:
+                self.root.after(0, on_error, e)
+                return
+            self.root.after(0, on_loaded, tutorials)
+        
+        threading.Thread(target=list_thread, daemon=True).start()
+    
+    def _export_all_tutorials(self):
+        """Export all tutorials to multiple formats"""
+        self._list_tutorials_then(self._export_tutorial_list)
+    
+    def _export_tutorial_list(self, tutorials):
+        """Ask for formats and export the given tutorials"""
+        if not tutorials:
+            messagebox.showinfo("No Tutorials", "No tutorials found to export.")
+            return
+        
+        # Show format selection dialog
+        if self._export_dialog is None:
+            self._build_export_dialog()
+        
+        format_dialog = self._export_dialog
+        self._export_heading_var.set(f"Export {len(tutorials)} tutorial(s) to:")
+        for format_key, var in self._export_format_vars.items():
+            var.set(format_key in ['html', 'word'])  # Default to HTML and Word
+        self._export_dialog_result.set('')
+        
+        self._place_dialog(format_dialog)
+        format_dialog.grab_set()
         
         # Wait for dialog
-        self.root.wait_window(format_dialog)
+        self.root.wait_variable(self._export_dialog_result)
         
-        if result['cancelled']:
+        format_dialog.grab_release()
+        format_dialog.withdraw()
+        
+        if self._export_dialog_result.get() != 'export':
             return
         
         # Perform export
         try:
-            formats = result['formats']
+            formats = [k for k, v in self._export_format_vars.items() if v.get()]
             format_list = ', '.join(f.upper() for f in formats)
             
             # Show progress dialog
-            progress = tk.Toplevel(self.root)
-            progress.title("Exporting...")
-            progress.geometry("350x150")
-            progress.transient(self.root)
-            progress.grab_set()
-            progress.resizable(False, False)
+            self._show_progress("Exporting...",
+                                f"Exporting {len(tutorials)} tutorials to {format_list}...",
+                                maximum=len(tutorials))
             
-            # Center progress dialog
-            progress.update_idletasks()
-            x = (progress.winfo_screenwidth() // 2) - (350 // 2)
-            y = (progress.winfo_screenheight() // 2) - (150 // 2)
-            progress.geometry(f"350x150+{x}+{y}")
+            def on_progress(completed, total):
+                # Called from the export thread; the Tk thread picks it up in _pump_progress_ui
+                self._report_progress(completed)
             
-            tk.Label(progress, text=f"Exporting {len(tutorials)} tutorials to {format_list}...", 
-                    font=('Arial', 10)).pack(pady=20)
-            tk.Label(progress, text="Please wait, this may take a while.", 
-                    font=('Arial', 9, 'italic')).pack()
+            def show_results(results):
+                # Close progress dialog
+                self._hide_progress()
+                
+                # Show results; every per-tutorial result is a dict and failures carry an 'error' key
+                total = len(results)
+                failed = sum('error' in r for r in results.values())
+                successful = total - failed
+                
+                message = f"Export completed:\n\n"
+                message += f"Total tutorials: {total}\n"
+                message += f"Successfully exported: {successful}\n"
+                message += f"Failed: {failed}\n\n"
+                message += f"Formats: {format_list}"
+                
+                messagebox.showinfo("Export Complete", message)
             
-            progress.update()
+            def show_error(error):
+                self._hide_progress()
+                messagebox.showerror("Export Failed", f"Failed to export tutorials: {error}")
             
             def export_thread():
                 try:
-                    results = self.app.export_all_tutorials(formats, max_workers=3)
-                    
-                    # Close progress dialog
-                    progress.destroy()
-                    
-                    # Show results
-                    successful = sum(1 for r in results.values() if isinstance(r, dict) and 'error' not in r)
-                    total = len(results)
-                    failed = total - successful
-                    
-                    message = f"Export completed:\n\n"
-                    message += f"Total tutorials: {total}\n"
-                    message += f"Successfully exported: {successful}\n"
-                    message += f"Failed: {failed}\n\n"
-                    message += f"Formats: {format_list}"
-                    
-                    messagebox.showinfo("Export Complete", message)
-                    
+                    results = self.app.export_all_tutorials(formats, max_workers=3,
+                                                            progress_callback=on_progress)
+                    self.root.after(0, show_results, results)
                 except Exception as e:
-                    progress.destroy()
-                    messagebox.showerror("Export Failed", f"Failed to export tutorials: {e}")
+                    self.root.after(0, show_error, e)
             
             # Run export in background thread
             threading.Thread(target=export_thread, daemon=True).start()
@@ -695,54 +1120,72 @@ class MainWindow:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to start export: {e}")
     
+    def _confirm_delete_all(self, count: int) -> bool:
+        """Ask for Delete All confirmation; the user must type DELETE ALL to proceed"""
+        dialog = tk.Toplevel(self.root, width=420, height=320)
+        dialog.withdraw()
+        dialog.title("Confirm Delete All")
+        dialog.transient(self.root)
+        dialog.resizable(False, False)
+        dialog.pack_propagate(False)  # Keep the fixed size regardless of content
+        
+        tk.Label(dialog, text=f"Delete ALL {count} tutorial(s)?",
+                font=('Arial', 12, 'bold')).pack(pady=(20, 10))
+        tk.Label(dialog, justify=tk.LEFT, font=('Arial', 10),
+                text="This action cannot be undone and will permanently remove:\n"
+                     "- All tutorial data and metadata\n"
+                     "- All screenshots and recordings\n"
+                     "- All exported files (HTML, Word, PDF, etc.)").pack(padx=20)
+        tk.Label(dialog, text="Type DELETE ALL to confirm:",
+                font=('Arial', 10, 'bold')).pack(pady=(15, 5))
+        
+        confirm_var = tk.StringVar()
+        entry = tk.Entry(dialog, textvariable=confirm_var, width=20)
+        entry.pack()
+        
+        result = {'confirmed': False}
+        
+        def on_delete():
+            result['confirmed'] = True
+            dialog.destroy()
+        
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=20)
+        delete_btn = tk.Button(button_frame, text="Delete All", command=on_delete, bg='#dc3545',
+                              fg='white', padx=20, pady=5, state='disabled')
+        delete_btn.pack(side=tk.LEFT, padx=10)
+        tk.Button(button_frame, text="Cancel", command=dialog.destroy, padx=20, pady=5).pack(side=tk.LEFT)
+        
+        confirm_var.trace_add('write', lambda *args: delete_btn.config(
+            state='normal' if confirm_var.get().strip() == "DELETE ALL" else 'disabled'))
+        
+        self._place_dialog(dialog)
+        dialog.grab_set()
+        entry.focus_set()
+        self.root.wait_window(dialog)
+        return result['confirmed']
+    
     def _delete_all_tutorials(self):
         """Delete all tutorials with confirmation"""
-        tutorials = self.app.list_tutorials()
-        
+        self._list_tutorials_then(self._delete_tutorial_list)
+    
+    def _delete_tutorial_list(self, tutorials):
+        """Confirm and delete the given tutorials"""
         if not tutorials:
             messagebox.showinfo("No Tutorials", "No tutorials found to delete.")
             return
         
-        # Double confirmation for safety
-        if not messagebox.askyesno("Confirm Delete All", 
-                                  f"Are you sure you want to delete ALL {len(tutorials)} tutorial(s)?\n\n"
-                                  "This action cannot be undone and will permanently remove:\n"
-                                  "• All tutorial data and metadata\n"
-                                  "• All screenshots and recordings\n"
-                                  "• All exported files (HTML, Word, PDF, etc.)\n\n"
-                                  "This is a destructive operation!"):
+        if not self._confirm_delete_all(len(tutorials)):
             return
         
-        # Final confirmation
-        if not messagebox.askyesno("Final Warning", 
-                                  "This is your FINAL warning.\n\n"
-                                  f"ALL {len(tutorials)} tutorials will be permanently deleted.\n\n"
-                                  "Are you absolutely certain you want to continue?"):
-            return
+        # Show progress; the Tk event loop keeps running while the worker deletes,
+        # so no manual update() pumping is needed to paint the dialog
+        self._show_progress("Deleting Tutorials...",
+                            f"Deleting {len(tutorials)} tutorials...",
+                            maximum=len(tutorials), width=300, height=120)
         
-        try:
-            # Show progress
-            progress = tk.Toplevel(self.root)
-            progress.title("Deleting Tutorials...")
-            progress.geometry("300x100")
-            progress.transient(self.root)
-            progress.grab_set()
-            progress.resizable(False, False)
-            
-            # Center progress dialog
-            progress.update_idletasks()
-            x = (progress.winfo_screenwidth() // 2) - (300 // 2)
-            y = (progress.winfo_screenheight() // 2) - (100 // 2)
-            progress.geometry(f"300x100+{x}+{y}")
-            
-            tk.Label(progress, text=f"Deleting {len(tutorials)} tutorials...", 
-                    font=('Arial', 10)).pack(pady=30)
-            progress.update()
-            
-            # Delete all tutorials
-            results = self.app.delete_all_tutorials()
-            
-            progress.destroy()
+        def show_results(results):
+            self._hide_progress()
             
             # Show results
             successful = sum(1 for success in results.values() if success)
@@ -755,25 +1198,45 @@ class MainWindow:
             message += f"Failed: {failed}"
             
             # Refresh tutorial list
-            self._refresh_tutorials()
+            self._schedule_refresh()
             
             messagebox.showinfo("Delete Complete", message)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete tutorials: {e}")
+        
+        def show_error(error):
+            self._hide_progress()
+            self._schedule_refresh()
+            messagebox.showerror("Error", f"Failed to delete tutorials: {error}")
+        
+        def delete_thread():
+            try:
+                # Delete exactly the tutorials the user confirmed, in one bulk call
+                results = self.app.delete_tutorials([t.tutorial_id for t in tutorials],
+                                                    progress_callback=lambda done, total:
+                                                    self._report_progress(done))
+                self.root.after(0, show_results, results)
+            except Exception as e:
+                self.root.after(0, show_error, e)
+        
+        threading.Thread(target=delete_thread, daemon=True).start()
     
     def _on_closing(self):
         """Handle window closing"""
         if self.app.current_session and self.app.current_session.is_recording():
             if messagebox.askyesno("Recording in Progress", 
                                  "A recording is in progress. Stop recording before closing?"):
-                self._stop_recording()
+                # Finish processing before the window goes away; there is no UI left to update
+                try:
+                    self.app.stop_recording()
+                except Exception as e:
+                    messagebox.showerror("Error", f"Failed to stop recording: {e}")
             else:
                 return
         
-        # Hide recording controls
+        # Tear down recording controls; this is the only place they are destroyed
+        self._cancel_hide_recording_controls()
         if self.recording_window:
-            self.recording_window.hide()
+            self.recording_window.destroy()
+            self.recording_window = None
         
         self.root.destroy()
     
@@ -822,10 +1285,8 @@ class MainWindow:
             # Use thread-safe UI updates
             def update_ui():
                 if event_type == 'recording_started':
-                    self.status_var.set("Recording...")
-                    self.start_btn.config(state='disabled')
-                    self.stop_btn.config(state='normal')
-                    self.new_btn.config(state='disabled')
+                    self._apply_control_state(status="Recording...", new='disabled',
+                                              start='disabled', stop='normal')
                     # Show recording controls if not already shown
                     if not self.recording_window or not self.recording_window.is_visible:
                         self._show_recording_controls()
@@ -835,20 +1296,23 @@ class MainWindow:
                     step_count = data.get('step_count', 0)
                     title = data.get('title', 'Unknown')
                     
-                    self.status_var.set(f"Recording completed: {step_count} steps captured")
+                    self._apply_control_state(status=f"Recording completed: {step_count} steps captured")
                     self._reset_controls()
-                    self._refresh_tutorials()
+                    if tutorial_id:
+                        self._update_tutorial_row(tutorial_id)
+                    else:
+                        self._schedule_refresh()
                     
                     # Show completion stats and then hide recording controls
                     if self.recording_window:
                         self.recording_window.show_completion_stats(step_count, title)
-                        self.root.after(3000, lambda: self.recording_window.hide() if self.recording_window else None)
+                        self._schedule_hide_recording_controls()
                 
                 elif event_type == 'recording_paused':
-                    self.status_var.set("Recording paused...")
+                    self._apply_control_state(status="Recording paused...")
                 
                 elif event_type == 'recording_resumed':
-                    self.status_var.set("Recording...")
+                    self._apply_control_state(status="Recording...")
             
             # Schedule UI update on main thread
             self.root.after(0, update_ui)
@@ -14,16 +14,50 @@ if TYPE_CHECKING:
 
 from ..core.logger import get_logger
 
+# Shared by the status line and the live step/duration values
+VALUE_FONT = ('Helvetica', 10, 'bold')
+
+# Whole seconds -> "MM:SS"; bounded to two hours of recording
+_DURATION_STRINGS: dict = {}
+_DURATION_STRINGS_MAX = 7200
+
+
+def _format_duration(duration: float) -> str:
+    """Format a duration in seconds as MM:SS, reusing strings already built"""
+    key = int(duration)
+    text = _DURATION_STRINGS.get(key)
+    if text is None:
+        minutes, seconds = divmod(key, 60)
+        text = f"{minutes:02d}:{seconds:02d}"
+        if len(_DURATION_STRINGS) < _DURATION_STRINGS_MAX:
+            _DURATION_STRINGS[key] = text
+    return text
+
+
+def _init_styles(style: ttk.Style):
+    """Configure the label styles used by the control window
+    
+    Widgets reference these by name, so each font is parsed once per style
+    rather than once per label.
+    """
+    style.configure('ControlValue.TLabel', font=VALUE_FONT)
+    style.configure('ControlCaption.TLabel', font=('Helvetica', 9))
+    style.configure('ControlName.TLabel', font=('Helvetica', 9, 'bold'), foreground='blue')
+
 
 class RecordingControlWindow:
     """Floating control panel for recording sessions"""
     
+    # Fallback duration tick when there is no session clock to align to
+    DURATION_TICK_MS = 250
+    # Wake this long after the shown second rolls over so the new value is ready
+    TICK_SLACK_MS = 20
+    
     def __init__(self, app: 'TutorialMakerApp', main_window: 'MainWindow'):
         self.app = app
         self.main_window = main_window
         self.window: Optional[tk.Toplevel] = None
         self.is_visible = False
-        self.debug_mode = getattr(app, 'debug_mode', False)
         self.logger = get_logger('gui.recording_controls')
         
         # Control variables
@@ -32,9 +66,27 @@ class RecordingControlWindow:
         self.status_var = tk.StringVar(value="Recording")
         self.tutorial_name_var = tk.StringVar(value="No Tutorial")
         
-        # Update timer
+        # Text last written to each display variable, so no-op updates skip Tcl entirely
+        self._shown: dict = {}
+        
+        # Monitor layout used for placement; refreshed each time the window is shown
+        self._monitors_cache: Optional[list] = None
+        
+        # Last status snapshot applied to the display
+        self._last_status: Optional[dict] = None
+        
+        # Duration ticker - everything else is pushed through the app's UI callbacks
         self.update_timer: Optional[str] = None
         
+        # Pointer offset within the window when a drag starts
+        self.drag_start_x = 0
+        self.drag_start_y = 0
+        
+    @property
+    def debug_mode(self) -> bool:
+        """Read live from the app so toggling debug mode applies without rebuilding"""
+        return getattr(self.app, 'debug_mode', False)
+    
     def _create_window(self):
         """Create the floating control window"""
         if self.window:
@@ -55,17 +107,16 @@ class RecordingControlWindow:
         except:
             pass
         
+        _init_styles(ttk.Style(self.window))
         self._create_widgets()
         self._setup_bindings()
         
-        # Dynamically size window to fit content
-        self._auto_size_window()
-        
-        # Position window in top-right corner after sizing
-        self._position_window()
+        # Size window to fit content and position it in one pass
+        self._layout_and_place()
         
-        # Start update timer
-        self._start_updates()
+        # Status and title changes arrive as app events, step counts on their own
+        self.app.register_ui_callback(self._on_session_event)
+        self.app.register_step_callback(self._on_step_added)
     
     def _create_widgets(self):
         """Create control widgets"""
@@ -80,23 +131,22 @@ class RecordingControlWindow:
         status_frame = ttk.Frame(main_frame)
         status_frame.pack(fill=tk.X, pady=(0, 8))
         
-        # Recording indicator (red dot)
-        self.indicator_canvas = tk.Canvas(status_frame, width=12, height=12, 
-                                        highlightthickness=0, bg='white')
-        self.indicator_canvas.pack(side=tk.LEFT, padx=(0, 5))
-        self._draw_indicator()
+        # Recording indicator (red block); recoloring it is a single configure call
+        self.indicator_label = tk.Label(status_frame, text=" ", width=2, bg="#FF0000")
+        self.indicator_label.pack(side=tk.LEFT, padx=(0, 5))
+        self._indicator_recording = True
         
-        status_label = ttk.Label(status_frame, textvariable=self.status_var, 
-                               font=('Helvetica', 10, 'bold'))
+        status_label = ttk.Label(status_frame, textvariable=self.status_var,
+                                 style='ControlValue.TLabel')
         status_label.pack(side=tk.LEFT)
         
         # Tutorial name frame
         name_frame = ttk.Frame(main_frame)
         name_frame.pack(fill=tk.X, pady=(0, 8))
         
-        ttk.Label(name_frame, text="Tutorial:", font=('Helvetica', 9)).pack(side=tk.LEFT)
-        tutorial_name_label = ttk.Label(name_frame, textvariable=self.tutorial_name_var, 
-                                      font=('Helvetica', 9, 'bold'), foreground='blue')
+        ttk.Label(name_frame, text="Tutorial:", style='ControlCaption.TLabel').pack(side=tk.LEFT)
+        tutorial_name_label = ttk.Label(name_frame, textvariable=self.tutorial_name_var,
+                                        style='ControlName.TLabel')
         tutorial_name_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # Stats frame
@@ -105,11 +155,11 @@ class RecordingControlWindow:
         
         ttk.Label(stats_frame, text="Steps:").pack(side=tk.LEFT)
         ttk.Label(stats_frame, textvariable=self.step_count_var, 
-                 font=('Helvetica', 10, 'bold')).pack(side=tk.LEFT, padx=(5, 15))
+                 style='ControlValue.TLabel').pack(side=tk.LEFT, padx=(5, 15))
         
         ttk.Label(stats_frame, text="Duration:").pack(side=tk.LEFT)
         ttk.Label(stats_frame, textvariable=self.duration_var, 
-                 font=('Helvetica', 10, 'bold')).pack(side=tk.LEFT, padx=(5, 0))
+                 style='ControlValue.TLabel').pack(side=tk.LEFT, padx=(5, 0))
         
         # Control buttons
         button_frame = ttk.Frame(main_frame)
@@ -151,8 +201,13 @@ class RecordingControlWindow:
 
         # Removed minimize button - users can move the panel or use system tray instead
     
-    def _auto_size_window(self):
-        """Automatically size window to fit all content"""
+    def _layout_and_place(self, place: bool = True):
+        """Size the window to fit its content and, optionally, position it
+        
+        One layout pass serves both calculations and the result is applied
+        with a single geometry() call. Placement prefers a different monitor
+        than the one being recorded.
+        """
         if not self.window:
             return
         
@@ -160,91 +215,91 @@ class RecordingControlWindow:
         self.window.update_idletasks()
         
         # Get the required width and height from the main frame
-        main_frame = self.window.winfo_children()[0] if self.window.winfo_children() else None
-        if main_frame:
-            main_frame.update_idletasks()
-            
-            # Get required size with some padding
-            req_width = main_frame.winfo_reqwidth() + 20  # Add padding
-            req_height = main_frame.winfo_reqheight() + 40  # Add padding for title bar
-            
-            # Set minimum and maximum sizes
-            min_width, max_width = 350, 450  # Increased minimum width for better button visibility
-            min_height, max_height = 200, 350  # Increased minimum height
-            
-            # Constrain to reasonable bounds
-            final_width = max(min_width, min(max_width, req_width))
-            final_height = max(min_height, min(max_height, req_height))
-            
-            # Apply the new size
-            self.window.geometry(f"{final_width}x{final_height}")
-            
-            if self.debug_mode:
-                print(f"Auto-sized recording controls: {final_width}x{final_height} (required: {req_width}x{req_height})")
-    
-    def _position_window(self):
-        """Position window intelligently - on different monitor when possible"""
-        if not self.window:
+        children = self.window.winfo_children()
+        if not children:
             return
+        main_frame = children[0]
         
-        # Get window dimensions
-        self.window.update_idletasks()
-        window_width = self.window.winfo_width()
+        # Get required size with some padding
+        req_width = main_frame.winfo_reqwidth() + 20  # Add padding
+        req_height = main_frame.winfo_reqheight() + 40  # Add padding for title bar
+        
+        # Set minimum and maximum sizes
+        min_width, max_width = 350, 450  # Increased minimum width for better button visibility
+        min_height, max_height = 200, 350  # Increased minimum height
         
-        # Try to get smart positioning based on recording monitor
-        x_pos, y_pos = self._get_smart_position(window_width)
+        # Constrain to reasonable bounds
+        final_width = max(min_width, min(max_width, req_width))
+        final_height = max(min_height, min(max_height, req_height))
         
-        self.window.geometry(f"+{x_pos}+{y_pos}")
+        geometry = f"{final_width}x{final_height}"
+        if place:
+            x_pos, y_pos = self._get_smart_position(final_width)
+            geometry += f"+{x_pos}+{y_pos}"
+        self.window.geometry(geometry)
+        
+        if self.debug_mode:
+            print(f"Auto-sized recording controls: {final_width}x{final_height} (required: {req_width}x{req_height})")
     
     def _get_smart_position(self, window_width: int) -> tuple[int, int]:
         """Get smart position for controls - prefer different monitor than recording"""
         try:
-            # Get current session and recording monitor
-            current_session = getattr(self.app, 'current_session', None)
-            if not current_session:
-                # Try session_manager.current_session as backup
-                session_manager = getattr(self.app, 'session_manager', None)
-                if session_manager:
-                    current_session = getattr(session_manager, 'current_session', None)
-            
-            recording_monitor = None
-            if current_session and hasattr(current_session, 'monitor_id'):
-                recording_monitor = current_session.monitor_id
-                self.logger.debug(f"Recording on monitor {recording_monitor}")
-            elif current_session:
-                # Try to get selected_monitor property
-                recording_monitor = getattr(current_session, 'selected_monitor', None)
-                self.logger.debug(f"Recording on monitor {recording_monitor} (via selected_monitor)")
-            else:
-                self.logger.debug("No current session found, will use fallback positioning")
-            
-            # Get screen info
-            screen_info = self.app.screen_capture.get_screen_info()
-            monitors = screen_info.get('monitors', [])
-            self.logger.debug(f"Found {len(monitors)} monitors")
+            # Get screen info; enumerating monitors opens a new capture handle, so
+            # it is done once per recording rather than on every placement
+            if self._monitors_cache is None:
+                screen_info = self.app.screen_capture.get_screen_info()
+                self._monitors_cache = screen_info.get('monitors', [])
+            monitors = self._monitors_cache
+            if self.debug_mode:
+                self.logger.debug(f"Found {len(monitors)} monitors")
             
             # Debug: Print all monitor info
-            for i, monitor in enumerate(monitors, 1):
-                self.logger.debug(f"Monitor {i}: left={monitor.get('left')}, top={monitor.get('top')}, width={monitor.get('width')}, height={monitor.get('height')}")
-            
-            if len(monitors) > 1 and recording_monitor is not None:
-                # Multiple monitors - try to place on different monitor
+            if self.debug_mode:
                 for i, monitor in enumerate(monitors, 1):
-                    if i != recording_monitor:  # Different monitor
-                        # Position on top-right of this monitor
-                        monitor_left = monitor.get('left', 0)
-                        monitor_top = monitor.get('top', 0)
-                        monitor_width = monitor.get('width', 1920)
-                        x_pos = monitor_left + monitor_width - window_width - 20
-                        y_pos = monitor_top + 50
-                        self.logger.debug(f"Placing controls on monitor {i} at ({x_pos}, {y_pos}) (monitor bounds: left={monitor_left}, top={monitor_top}, width={monitor_width}) (different from recording monitor {recording_monitor})")
-                        return x_pos, y_pos
+                    self.logger.debug(f"Monitor {i}: left={monitor.get('left')}, top={monitor.get('top')}, width={monitor.get('width')}, height={monitor.get('height')}")
+            
+            if len(monitors) > 1:
+                # Get current session and recording monitor
+                current_session = getattr(self.app, 'current_session', None)
+                if not current_session:
+                    # Try session_manager.current_session as backup
+                    session_manager = getattr(self.app, 'session_manager', None)
+                    if session_manager:
+                        current_session = getattr(session_manager, 'current_session', None)
+                
+                recording_monitor = None
+                if current_session and hasattr(current_session, 'monitor_id'):
+                    recording_monitor = current_session.monitor_id
+                    if self.debug_mode:
+                        self.logger.debug(f"Recording on monitor {recording_monitor}")
+                elif current_session:
+                    # Try to get selected_monitor property
+                    recording_monitor = getattr(current_session, 'selected_monitor', None)
+                    if self.debug_mode:
+                        self.logger.debug(f"Recording on monitor {recording_monitor} (via selected_monitor)")
+                elif self.debug_mode:
+                    self.logger.debug("No current session found, will use fallback positioning")
+                
+                if recording_monitor is not None:
+                    # Multiple monitors - try to place on different monitor
+                    for i, monitor in enumerate(monitors, 1):
+                        if i != recording_monitor:  # Different monitor
+                            # Position on top-right of this monitor
+                            monitor_left = monitor.get('left', 0)
+                            monitor_top = monitor.get('top', 0)
+                            monitor_width = monitor.get('width', 1920)
+                            x_pos = monitor_left + monitor_width - window_width - 20
+                            y_pos = monitor_top + 50
+                            if self.debug_mode:
+                                self.logger.debug(f"Placing controls on monitor {i} at ({x_pos}, {y_pos}) (monitor bounds: left={monitor_left}, top={monitor_top}, width={monitor_width}) (different from recording monitor {recording_monitor})")
+                            return x_pos, y_pos
             
             # Fallback to primary monitor or single monitor
             screen_width = self.window.winfo_screenwidth()
             x_pos = screen_width - window_width - 20
             y_pos = 50
-            self.logger.debug(f"Using fallback position at ({x_pos}, {y_pos}) - single monitor or no recording monitor detected")
+            if self.debug_mode:
+                self.logger.debug(f"Using fallback position at ({x_pos}, {y_pos}) - single monitor or no recording monitor detected")
             return x_pos, y_pos
             
         except Exception as e:
@@ -262,33 +317,43 @@ class RecordingControlWindow:
         self.window.bind("<Button-1>", self._on_window_click)
         self.window.bind("<B1-Motion>", self._on_window_drag)
         
+        # Catch up on anything skipped while iconified
+        self.window.bind("<Map>", self._on_map)
+        
         # Close button handling
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _draw_indicator(self, recording=True):
-        """Draw recording indicator dot"""
-        if not hasattr(self, 'indicator_canvas'):
+        """Color the recording indicator; no-op when the state is unchanged"""
+        if not hasattr(self, 'indicator_label') or recording == self._indicator_recording:
             return
         
-        self.indicator_canvas.delete("all")
         color = "#FF0000" if recording else "#FFA500"  # Red when recording, orange when paused
-        self.indicator_canvas.create_oval(2, 2, 10, 10, fill=color, outline="")
+        self.indicator_label.config(bg=color)
+        self._indicator_recording = recording
+    
+    def _on_map(self, event):
+        """Resync the display when the window becomes viewable again"""
+        if event.widget is self.window and self.is_visible:
+            self._update_stats()
     
     def _toggle_pause(self):
         """Toggle pause/resume recording"""
         try:
-            status = self.app.get_current_session_status()
+            status = self._last_status or self.app.get_current_session_status()
             current_status = status.get('status', 'stopped')
+            # The snapshot is stale once we act on it; re-query until the next event lands
+            self._last_status = None
             
             if current_status == 'recording':
                 self.app.pause_recording()
                 self.pause_btn.config(text="Resume")
-                self.status_var.set("Paused")
+                self._set_if_changed(self.status_var, "Paused")
                 self._draw_indicator(recording=False)
             elif current_status == 'paused':
                 self.app.resume_recording()
                 self.pause_btn.config(text="Pause")
-                self.status_var.set("Recording")
+                self._set_if_changed(self.status_var, "Recording")
                 self._draw_indicator(recording=True)
         except Exception as e:
             print(f"Error toggling pause: {e}")
@@ -304,10 +369,9 @@ class RecordingControlWindow:
     
     def _on_window_drag(self, event):
         """Handle window dragging"""
-        if hasattr(self, 'drag_start_x') and hasattr(self, 'drag_start_y'):
-            x = self.window.winfo_x() + (event.x - self.drag_start_x)
-            y = self.window.winfo_y() + (event.y - self.drag_start_y)
-            self.window.geometry(f"+{x}+{y}")
+        x = self.window.winfo_x() + (event.x - self.drag_start_x)
+        y = self.window.winfo_y() + (event.y - self.drag_start_y)
+        self.window.geometry(f"+{x}+{y}")
     
     def _toggle_keystroke_filtering(self):
         """Toggle keystroke filtering on/off"""
@@ -346,58 +410,154 @@ class RecordingControlWindow:
             # Revert checkbox state on error
             self.manual_only_mode_var.set(not self.manual_only_mode_var.get())
     
-    def _start_updates(self):
-        """Start periodic updates of recording stats"""
+    def _schedule_tick(self):
+        """Arm the duration ticker; any timer already armed is replaced, never stacked"""
+        self._stop_updates()
+        if self.window:
+            self.update_timer = self.window.after(self._next_tick_delay(), self._tick)
+    
+    def _next_tick_delay(self) -> int:
+        """Milliseconds until the displayed MM:SS next changes
+        
+        Each tick is re-aimed at the session clock's next whole second, so
+        the timer wakes once per displayed change and timer lateness never
+        accumulates into drift.
+        """
+        session = getattr(self.app, 'current_session', None)
+        if session is None:
+            return self.DURATION_TICK_MS
+        remaining = 1.0 - session.get_duration() % 1.0
+        return int(remaining * 1000) + self.TICK_SLACK_MS
+    
+    def _tick(self):
+        """Refresh the duration display and re-arm while visible"""
+        if not self.window or not self.is_visible:
+            self.update_timer = None
+            return
+        # Keep ticking while iconified, but only redraw what can be seen
+        if self.window.winfo_viewable():
+            self._update_duration()
+        self._schedule_tick()
+    
+    def _stop_updates(self):
+        """Cancel the duration ticker"""
+        if self.update_timer and self.window:
+            self.window.after_cancel(self.update_timer)
+        self.update_timer = None
+    
+    def _set_if_changed(self, var: tk.Variable, value: str) -> bool:
+        """Set a display variable only when its text differs from what was last shown
+        
+        The comparison is against a Python-side record rather than var.get(),
+        so unchanged values cost no Tcl round trip. Display variables must
+        only be written through here to keep that record accurate.
+        """
+        name = str(var)
+        if self._shown.get(name) == value:
+            return False
+        var.set(value)
+        self._shown[name] = value
+        return True
+    
+    def _update_duration(self):
+        """Refresh only the duration label
+        
+        Reads the session clock directly rather than building a full status
+        snapshot; the label is only written when the shown second changes.
+        """
+        session = getattr(self.app, 'current_session', None)
+        if session is None:
+            return
+        self._set_if_changed(self.duration_var, _format_duration(session.get_duration()))
+    
+    def _on_session_event(self, event_type: str, data: dict):
+        """App UI callback - may run on a listener thread, so hop onto the Tk thread"""
         if self.window and self.is_visible:
-            self._update_stats()
-            self.update_timer = self.window.after(1000, self._start_updates)  # Update every second
+            try:
+                self.window.after(0, self._apply_status, data)
+            except (RuntimeError, tk.TclError):
+                pass  # Window torn down mid-event
+    
+    def _on_step_added(self, step_count: int):
+        """App step callback - runs on the listener thread, so hop onto the Tk thread"""
+        if self.window and self.is_visible:
+            try:
+                self.window.after(0, self._apply_step_count, step_count)
+            except (RuntimeError, tk.TclError):
+                pass  # Window torn down mid-event
+    
+    def _apply_step_count(self, step_count: int):
+        """Show a new step count; iconified windows catch up on <Map>"""
+        if self.window and self.is_visible and self.window.winfo_viewable():
+            self._set_if_changed(self.step_count_var, str(step_count))
     
     def _update_stats(self):
-        """Update recording statistics"""
+        """Sync every display field with the current session status"""
+        # Don't query the app for a window nobody can see; <Map> resyncs it later
+        if not self.window or not self.is_visible or not self.window.winfo_viewable():
+            return
         try:
-            status = self.app.get_current_session_status()
-
-            if status.get('status') != 'no_session':
-                # Update step count
-                step_count = status.get('step_count', 0)
-                self.step_count_var.set(str(step_count))
-
-                # Update duration
-                duration = status.get('duration', 0)
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                self.duration_var.set(f"{minutes:02d}:{seconds:02d}")
-
-                # Update tutorial name
-                tutorial_title = status.get('title', 'No Tutorial')
-                # Truncate long titles
-                if len(tutorial_title) > 25:
-                    tutorial_title = tutorial_title[:22] + "..."
-                self.tutorial_name_var.set(tutorial_title)
-
-                # Update status
-                session_status = status.get('status', 'stopped')
-                if session_status == 'recording':
-                    self.status_var.set("Recording")
-                    self._draw_indicator(recording=True)
-                elif session_status == 'paused':
-                    self.status_var.set("Paused")
-                    self._draw_indicator(recording=False)
-
-                # Update manual-only mode checkbox state (sync with hotkey toggles)
-                manual_only_mode = status.get('manual_only_mode', False)
-                if self.manual_only_mode_var.get() != manual_only_mode:
-                    self.manual_only_mode_var.set(manual_only_mode)
-
+            self._apply_status(self.app.get_current_session_status())
         except Exception as e:
             print(f"Error updating stats: {e}")
     
+    def _apply_status(self, status: dict):
+        """Apply a session status snapshot, touching only values that changed"""
+        if (not self.window or not self.is_visible or not self.window.winfo_viewable()
+                or status.get('status') == 'no_session'):
+            return
+        self._last_status = status
+        
+        if 'step_count' in status:
+            self._set_if_changed(self.step_count_var, str(status['step_count']))
+        
+        if 'duration' in status:
+            self._set_if_changed(self.duration_var, _format_duration(status['duration']))
+        
+        # Update tutorial name
+        if 'title' in status:
+            tutorial_title = status['title'] or 'No Tutorial'
+            # Truncate long titles
+            if len(tutorial_title) > 25:
+                tutorial_title = tutorial_title[:22] + "..."
+            self._set_if_changed(self.tutorial_name_var, tutorial_title)
+        
+        # Update status
+        session_status = status.get('status')
+        if session_status == 'recording' and self._set_if_changed(self.status_var, "Recording"):
+            self.pause_btn.config(text="Pause")
+            self._draw_indicator(recording=True)
+            # Resuming shifts the session clock's phase; realign the ticker to it
+            if self.update_timer:
+                self._schedule_tick()
+        elif session_status == 'paused' and self._set_if_changed(self.status_var, "Paused"):
+            self.pause_btn.config(text="Resume")
+            self._draw_indicator(recording=False)
+        
+        # Update manual-only mode checkbox state (sync with hotkey toggles); the user
+        # can flip the checkbox directly, so compare against Tk's value here
+        manual_only_mode = status.get('manual_only_mode')
+        if manual_only_mode is not None and self.manual_only_mode_var.get() != manual_only_mode:
+            self.manual_only_mode_var.set(manual_only_mode)
+    
     def _on_close(self):
         """Handle window close"""
         self.hide()
     
     def show(self):
-        """Show the recording control window"""
+        """Show the recording control window
+        
+        The window is built once and reused: hide() only withdraws it, and
+        it is destroyed only when the main window closes.
+        """
+        if self.window is not None and not self.window.winfo_exists():
+            # Destroyed behind our back (e.g. with its parent); drop the stale handle
+            self.app.unregister_ui_callback(self._on_session_event)
+            self.app.unregister_step_callback(self._on_step_added)
+            self.window = None
+            self.update_timer = None
+        # Monitors may have changed between recordings
+        self._monitors_cache = None
         if not self.window:
             self._create_window()
         
@@ -407,10 +567,10 @@ class RecordingControlWindow:
             self.is_visible = True
             
             # Ensure proper sizing when showing
-            self.window.after(100, self._auto_size_window)
-            self.window.after(200, self._position_window)  # Increased delay to ensure session is available
+            self.window.after(200, self._layout_and_place)  # Delay so the session is available for placement
             
-            self._start_updates()
+            self._update_stats()
+            self._schedule_tick()
     
     def hide(self):
         """Hide the recording control window"""
@@ -419,37 +579,34 @@ class RecordingControlWindow:
             self.is_visible = False
             
             # Cancel update timer
-            if self.update_timer:
-                self.window.after_cancel(self.update_timer)
-                self.update_timer = None
+            self._stop_updates()
     
     def show_completion_stats(self, final_step_count: int, tutorial_name: str):
         """Show final recording stats before hiding"""
         if self.window and self.is_visible:
             # Update final stats
-            self.step_count_var.set(str(final_step_count))
-            self.status_var.set("SUCCESS: Completed")
+            self._set_if_changed(self.step_count_var, str(final_step_count))
+            self._set_if_changed(self.status_var, "SUCCESS: Completed")
             
             # Truncate tutorial name if too long
             if len(tutorial_name) > 25:
                 tutorial_name = tutorial_name[:22] + "..."
-            self.tutorial_name_var.set(tutorial_name)
+            self._set_if_changed(self.tutorial_name_var, tutorial_name)
             
             # Stop blinking indicator
             self._draw_indicator(recording=False)
             
             # Adjust window size for completion message
-            self.window.after(50, self._auto_size_window)
+            self.window.after(50, self._layout_and_place, False)
             
             # Stop updates
-            if self.update_timer:
-                self.window.after_cancel(self.update_timer)
-                self.update_timer = None
+            self._stop_updates()
     
     def destroy(self):
         """Destroy the recording control window"""
-        if self.update_timer and self.window:
-            self.window.after_cancel(self.update_timer)
+        self._stop_updates()
+        self.app.unregister_ui_callback(self._on_session_event)
+        self.app.unregister_step_callback(self._on_step_added)
         
         if self.window:
             self.window.destroy()
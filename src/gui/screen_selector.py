@@ -3,23 +3,33 @@ Screen Selection Dialog
 Allows users to select which monitor to record on, similar to Zoom's screen sharing dialog
 """
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, List
 from PIL import Image, ImageTk
 
 from ..core.capture import ScreenCapture
+from ..core.logger import get_logger
 
 
 class ScreenSelectorDialog:
     """Dialog for selecting which screen/monitor to record"""
     
+    # How often the Tk thread checks for finished previews
+    RESULT_POLL_MS = 50
+    
     def __init__(self, parent: tk.Widget, screen_capture: ScreenCapture):
         self.parent = parent
         self.screen_capture = screen_capture
         self.selected_monitor = None
         self.dialog = None
         self.thumbnails = {}
+        # monitor id -> (capture signature, PhotoImage), see _root_preview_cache
+        self._preview_cache: Dict[int, tuple] = {}
+        self.logger = get_logger('gui.screen_selector')
         
     def show(self) -> Optional[int]:
         """
@@ -46,10 +56,8 @@ class ScreenSelectorDialog:
         
         return self.selected_monitor
     
-    def _center_dialog(self):
-        """Center dialog on parent window"""
-        self.dialog.update_idletasks()
-        
+    def _center_position(self, dialog_width: int, dialog_height: int):
+        """Return the (x, y) that centers a dialog of the given size on the parent"""
         # Get parent window position and size
         if hasattr(self.parent, 'winfo_x'):
             parent_x = self.parent.winfo_x()
@@ -63,14 +71,9 @@ class ScreenSelectorDialog:
             parent_width = self.dialog.winfo_screenwidth() // 2
             parent_height = self.dialog.winfo_screenheight() // 2
         
-        # Calculate center position
-        dialog_width = self.dialog.winfo_width()
-        dialog_height = self.dialog.winfo_height()
-        
         x = parent_x + (parent_width - dialog_width) // 2
         y = parent_y + (parent_height - dialog_height) // 2
-        
-        self.dialog.geometry(f"+{x}+{y}")
+        return x, y
     
     def _create_widgets(self):
         """Create dialog widgets"""
@@ -107,42 +110,129 @@ class ScreenSelectorDialog:
         self.loading_label.pack(expand=True)
     
     def _load_screen_previews(self):
-        """Load screen preview thumbnails"""
+        """Load screen preview thumbnails
+        
+        Captures and resizes run on worker threads, one per monitor, so the
+        dialog stays responsive and the grabs overlap; only the PhotoImage
+        conversion happens back on the Tk thread.
+        
+        The worker hands its result over through a queue that the Tk thread
+        polls. Calling after() from the worker would need a running mainloop,
+        and when the dialog is opened from the CLI only wait_window() runs.
+        """
+        self._results = queue.Queue()
+        # Fetched here on the Tk thread; the workers only read it
+        self._preview_cache = self._root_preview_cache()
+        threading.Thread(target=self._capture_previews_worker, daemon=True).start()
+        self.dialog.after(self.RESULT_POLL_MS, self._poll_results)
+    
+    def _root_preview_cache(self) -> Dict[int, tuple]:
+        """Thumbnails from the last dialog shown on this Tk root
+        
+        PhotoImages belong to one Tk interpreter, so the cache hangs off the
+        root window and is freed with it, e.g. the temporary root the CLI
+        creates; it holds at most one entry per monitor.
+        """
+        root = self.dialog.nametowidget('.')
+        cache = getattr(root, '_screen_preview_cache', None)
+        if cache is None:
+            cache = root._screen_preview_cache = {}
+        return cache
+    
+    def _capture_previews_worker(self):
+        """Capture and shrink every monitor off the Tk thread"""
         try:
             # Get screen info
             screen_info = self.screen_capture.get_screen_info()
             monitors = screen_info.get('monitors', [])
             
-            if not monitors:
-                self._show_no_screens_message()
-                return
-            
-            # Generate thumbnails for each monitor
-            thumbnails = {}
-            for monitor in monitors:
-                try:
-                    # Capture monitor screenshot
-                    screenshot = self.screen_capture.capture_full_screen(monitor_id=monitor['id'])
-                    if screenshot:
-                        # Create thumbnail (200x150 max)
-                        thumbnail = self._create_thumbnail(screenshot, max_size=(200, 150))
-                        thumbnails[monitor['id']] = {
-                            'image': thumbnail,
-                            'monitor': monitor,
-                            'screenshot': screenshot
-                        }
-                except Exception as e:
-                    print(f"Failed to capture monitor {monitor['id']}: {e}")
-            
-            # Update UI directly (no threading needed)
-            self._display_screen_options(thumbnails)
-            
+            previews = {}
+            if monitors:
+                with ThreadPoolExecutor(max_workers=min(4, len(monitors))) as executor:
+                    results = executor.map(self._capture_preview, monitors)
+                    for monitor, result in zip(monitors, results):
+                        if result is not None:
+                            previews[monitor['id']] = result
         except Exception as e:
-            print(f"Error loading screen previews: {e}")
-            self._show_error_message()
+            self.logger.warning(f"Error loading screen previews: {e}")
+            self._post_to_dialog(self._show_error_message)
+            return
+        
+        if not monitors:
+            self._post_to_dialog(self._show_no_screens_message)
+        else:
+            self._post_to_dialog(self._on_previews_loaded, previews)
     
-    def _create_thumbnail(self, image: Image.Image, max_size: tuple) -> ImageTk.PhotoImage:
-        """Create a thumbnail from an image"""
+    def _capture_preview(self, monitor: Dict) -> Optional[Dict]:
+        """Capture one monitor and build its thumbnail image (worker thread)"""
+        try:
+            # Capture monitor screenshot
+            screenshot = self.screen_capture.capture_full_screen(monitor_id=monitor['id'])
+            if screenshot:
+                signature = self._capture_signature(screenshot)
+                cached = self._preview_cache.get(monitor['id'])
+                if cached is not None and cached[0] == signature:
+                    image = None  # Screen unchanged; the cached PhotoImage is reused
+                else:
+                    # Create thumbnail (200x150 max)
+                    image = self._resize_thumbnail(screenshot, max_size=(200, 150))
+                return {
+                    'image': image,
+                    'signature': signature,
+                    'monitor': monitor,
+                    'screenshot': screenshot
+                }
+        except Exception as e:
+            self.logger.warning(f"Failed to capture monitor {monitor['id']}: {e}")
+        return None
+    
+    def _post_to_dialog(self, callback, *args):
+        """Queue callback to run on the Tk thread (worker thread)"""
+        self._results.put((callback, args))
+    
+    def _poll_results(self):
+        """Run the worker's result on the Tk thread once it arrives"""
+        if not self.dialog.winfo_exists():
+            return  # Dialog cancelled before previews finished loading
+        try:
+            callback, args = self._results.get_nowait()
+        except queue.Empty:
+            self.dialog.after(self.RESULT_POLL_MS, self._poll_results)
+            return
+        callback(*args)
+    
+    def _on_previews_loaded(self, previews: Dict):
+        """Convert finished thumbnails to PhotoImages and show them (Tk thread)"""
+        thumbnails = {}
+        # Forget monitors that are gone
+        for monitor_id in list(self._preview_cache):
+            if monitor_id not in previews:
+                del self._preview_cache[monitor_id]
+        for monitor_id in sorted(previews):
+            data = previews[monitor_id]
+            cached = self._preview_cache.get(monitor_id)
+            if data['image'] is None and cached is not None and cached[0] == data['signature']:
+                photo = cached[1]
+            else:
+                image = data['image'] or self._resize_thumbnail(data['screenshot'], max_size=(200, 150))
+                photo = ImageTk.PhotoImage(image)
+                self._preview_cache[monitor_id] = (data['signature'], photo)
+            # Keep only what the grid needs; the full-size capture can be freed now
+            thumbnails[monitor_id] = {'image': photo, 'monitor': data['monitor']}
+        self._display_screen_options(thumbnails)
+    
+    @staticmethod
+    def _capture_signature(image: Image.Image) -> tuple:
+        """Cheap fingerprint of a capture: its size plus a hash of a coarse pixel grid
+        
+        NEAREST sampling reads only 128x72 pixels, so this costs a fraction
+        of a millisecond even for 4K captures.
+        """
+        sample = image.resize((128, 72), Image.Resampling.NEAREST)
+        return image.size, hash(sample.tobytes())
+    
+    def _resize_thumbnail(self, image: Image.Image, max_size: tuple) -> Image.Image:
+        """Shrink an image to fit max_size; touches no Tk state, so safe off-thread"""
         # Calculate thumbnail size maintaining aspect ratio
         img_width, img_height = image.size
         max_width, max_height = max_size
@@ -154,11 +244,10 @@ class ScreenSelectorDialog:
         new_width = int(img_width * scale)
         new_height = int(img_height * scale)
         
-        # Resize image
-        thumbnail = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Convert to PhotoImage
-        return ImageTk.PhotoImage(thumbnail)
+        # Resize image. reducing_gap lets Pillow box-reduce by an integer factor
+        # first, so BILINEAR only filters a small image; at 200px it looks the
+        # same as LANCZOS on the full-resolution capture at a fraction of the cost
+        return image.resize((new_width, new_height), Image.Resampling.BILINEAR, reducing_gap=2.0)
     
     def _display_screen_options(self, thumbnails: Dict):
         """Display screen selection options"""
@@ -177,7 +266,8 @@ class ScreenSelectorDialog:
         col = 0
         max_cols = 2
         
-        self.screen_vars = {}
+        # One variable shared by every radio button; Tk keeps the group in sync
+        self.selected_var = tk.IntVar(self.dialog, value=-1)
         
         for monitor_id, data in thumbnails.items():
             monitor = data['monitor']
@@ -189,17 +279,10 @@ class ScreenSelectorDialog:
                                          padding="10")
             screen_frame.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
             
-            # Configure grid weights
-            self.screens_frame.columnconfigure(col, weight=1)
-            self.screens_frame.rowconfigure(row, weight=1)
-            
             # Radio button for selection
-            var = tk.BooleanVar()
-            self.screen_vars[monitor_id] = var
-            
             radio = ttk.Radiobutton(screen_frame, 
-                                   variable=var,
-                                   value=True,
+                                   variable=self.selected_var,
+                                   value=monitor_id,
                                    command=lambda mid=monitor_id: self._on_screen_selected(mid))
             radio.pack(anchor=tk.W)
             
@@ -216,9 +299,12 @@ class ScreenSelectorDialog:
                                   font=('Helvetica', 9), foreground='gray')
             info_label.pack()
             
-            # Make clicking on frame select this option
-            for widget in [screen_frame, img_label, info_label]:
-                widget.bind("<Button-1>", lambda e, mid=monitor_id: self._on_screen_clicked(mid))
+            # Make clicking on frame select this option: one class binding
+            # per monitor, shared by the frame and its labels via a bindtag
+            tag = f"ScreenOption{monitor_id}"
+            self.dialog.bind_class(tag, "<Button-1>", lambda e, mid=monitor_id: self._on_screen_clicked(mid))
+            for widget in (screen_frame, img_label, info_label):
+                widget.bindtags((tag,) + widget.bindtags())
             
             # Move to next position
             col += 1
@@ -226,8 +312,15 @@ class ScreenSelectorDialog:
                 col = 0
                 row += 1
         
+        # Configure grid weights once for the cells actually used, not per screen
+        used_rows = (len(thumbnails) + max_cols - 1) // max_cols
+        for c in range(min(max_cols, len(thumbnails))):
+            self.screens_frame.columnconfigure(c, weight=1)
+        for r in range(used_rows):
+            self.screens_frame.rowconfigure(r, weight=1)
+        
         # Select primary monitor by default
-        if 1 in self.screen_vars:
+        if 1 in thumbnails:
             self._on_screen_selected(1)
         
         # Auto-size dialog to fit content
@@ -239,10 +332,7 @@ class ScreenSelectorDialog:
     
     def _on_screen_selected(self, monitor_id: int):
         """Handle screen selection"""
-        # Clear other selections
-        for mid, var in self.screen_vars.items():
-            var.set(mid == monitor_id)
-        
+        self.selected_var.set(monitor_id)
         self.selected_monitor = monitor_id
         self.select_btn.config(state='normal')
     
@@ -262,8 +352,21 @@ class ScreenSelectorDialog:
         self.selected_monitor = 1
         self.select_btn.config(state='normal')
     
+    def _release_previews(self):
+        """Drop this dialog's references to the preview images
+        
+        Unchanged thumbnails stay in the root's preview cache for the next
+        dialog; the rest are freed as soon as the dialog closes instead of at
+        GC time.
+        """
+        for data in self.thumbnails.values():
+            data['image'] = None
+        self.thumbnails.clear()
+        self._preview_cache = {}
+    
     def _on_select(self):
         """Handle select button click"""
+        self._release_previews()
         self.dialog.destroy()
     
     def _auto_size_dialog(self):
@@ -297,18 +400,17 @@ class ScreenSelectorDialog:
                 final_width = max(min_width, min(max_width, req_width))
                 final_height = max(min_height, min(max_height, req_height))
                 
-                # Apply new size
-                self.dialog.geometry(f"{final_width}x{final_height}")
-                
-                # Re-center after sizing
-                self.dialog.after(50, self._center_dialog)
+                # Apply new size and center it in the same geometry call
+                x, y = self._center_position(final_width, final_height)
+                self.dialog.geometry(f"{final_width}x{final_height}+{x}+{y}")
                 
         except Exception as e:
-            print(f"Error auto-sizing screen selector: {e}")
+            self.logger.warning(f"Error auto-sizing screen selector: {e}")
     
     def _on_cancel(self):
         """Handle cancel button click"""
         self.selected_monitor = None
+        self._release_previews()
         self.dialog.destroy()
 
 
@@ -4,86 +4,179 @@ Configure application preferences and recording options
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from typing import Dict, Any, TYPE_CHECKING
+from tkinter import ttk, messagebox
+from typing import Dict, Any, Optional, TYPE_CHECKING
+import copy
 import json
+import os
+import threading
+import time
 from pathlib import Path
 
 if TYPE_CHECKING:
     from ..core.app import TutorialMakerApp
 
+from ..core.logger import get_logger
+
+_SETTINGS_FILE = Path.home() / "TutorialMaker" / "settings.json"
+
+# Default settings; deep-copied before use, never modified
+_DEFAULT_SETTINGS: Dict[str, Dict[str, Any]] = {
+    'recording': {
+        'auto_export': False,
+        'export_formats': ['html'],
+        'debug_mode': False,
+        'pause_on_inactivity': False,
+        'inactivity_timeout': 30,
+        'default_monitor': None,  # None = auto-select, int = specific monitor
+    },
+    'ui': {
+        'start_minimized': False,
+        'show_notifications': True,
+        'floating_controls': True,
+        'always_on_top': True,
+    },
+    'hotkeys': {
+        'start_stop_recording': 'ctrl+shift+r',
+        'pause_resume': 'ctrl+shift+p',
+        'new_tutorial': 'ctrl+shift+n',
+        'toggle_floating_window': 'ctrl+shift+h',
+    },
+    'storage': {
+        'base_path': str(Path.home() / "TutorialMaker"),
+        'auto_cleanup_days': 30,
+        'max_storage_gb': 5.0,
+    }
+}
+
+# Scalar settings shown in each tab: (key, type). The tk variable for each
+# shares the key's name; numbers are edited as text and parsed back on save.
+_FIELDS = {
+    'recording': (
+        ('auto_export', bool),
+        ('debug_mode', bool),
+        ('pause_on_inactivity', bool),
+        ('inactivity_timeout', int),
+    ),
+    'ui': (
+        ('start_minimized', bool),
+        ('show_notifications', bool),
+        ('floating_controls', bool),
+        ('always_on_top', bool),
+    ),
+    'hotkeys': (
+        ('start_stop_recording', str),
+        ('pause_resume', str),
+        ('new_tutorial', str),
+        ('toggle_floating_window', str),
+    ),
+    'storage': (
+        ('base_path', str),
+        ('auto_cleanup_days', int),
+        ('max_storage_gb', float),
+    ),
+}
+
+# Export format checkboxes, in display order
+_EXPORT_FORMATS = ('html', 'word', 'pdf')
+
 
 class SettingsDialog:
     """Settings configuration dialog"""
     
+    # (storage stats, time.monotonic() when fetched), shared by every dialog;
+    # reused for STATS_TTL seconds so reopening settings skips the disk walk
+    _stats_cache: Optional[tuple] = None
+    STATS_TTL = 60.0
+    
+    # How long the inline "Settings applied" message stays up
+    STATUS_CLEAR_MS = 2000
+    
     def __init__(self, parent: tk.Widget, app: 'TutorialMakerApp'):
         self.parent = parent
         self.app = app
         self.dialog: tk.Toplevel = None
+        self.logger = get_logger('gui.settings_dialog')
         
-        # Settings data
+        # Settings data. _raw_settings is settings.json as read, so keys this
+        # dialog does not know about survive a save; _saved_payload is the JSON
+        # known to be on disk, if any
+        self._raw_settings: Dict[str, Any] = {}
+        self._saved_payload = None
         self.settings = self._load_settings()
         
         # UI variables
         self.vars = {}
         
+        # Pending after() id that clears the inline status message
+        self._status_timer = None
+        
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from file"""
-        settings_file = Path.home() / "TutorialMaker" / "settings.json"
-        
-        # Default settings
-        defaults = {
-            'recording': {
-                'auto_export': False,
-                'export_formats': ['html'],
-                'debug_mode': False,
-                'pause_on_inactivity': False,
-                'inactivity_timeout': 30,
-                'default_monitor': None,  # None = auto-select, int = specific monitor
-            },
-            'ui': {
-                'start_minimized': False,
-                'show_notifications': True,
-                'floating_controls': True,
-                'always_on_top': True,
-            },
-            'hotkeys': {
-                'start_stop_recording': 'ctrl+shift+r',
-                'pause_resume': 'ctrl+shift+p',
-                'new_tutorial': 'ctrl+shift+n',
-                'toggle_floating_window': 'ctrl+shift+h',
-            },
-            'storage': {
-                'base_path': str(Path.home() / "TutorialMaker"),
-                'auto_cleanup_days': 30,
-                'max_storage_gb': 5.0,
-            }
-        }
+        defaults = copy.deepcopy(_DEFAULT_SETTINGS)
+        self._raw_settings = {}
+        self._saved_payload = None
         
         try:
-            if settings_file.exists():
-                with open(settings_file, 'r') as f:
-                    saved_settings = json.load(f)
-                    # Merge with defaults
-                    for category, options in defaults.items():
-                        if category in saved_settings:
-                            options.update(saved_settings[category])
-                        defaults[category] = options
+            # Read the whole (small) file in one go; a missing file just means defaults
+            saved_settings = json.loads(_SETTINGS_FILE.read_text())
+            # Merge with defaults, one update per saved category
+            for category, saved_options in saved_settings.items():
+                if category in defaults and isinstance(saved_options, dict):
+                    defaults[category].update(saved_options)
+            self._raw_settings = saved_settings
+            self._saved_payload = self._settings_payload(defaults)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading settings: {e}")
         
         return defaults
     
+    def _settings_payload(self, settings: Dict[str, Any]) -> str:
+        """Serialize settings laid over the file as loaded, keeping unknown keys
+        
+        Only values that differ from _DEFAULT_SETTINGS are written; loading
+        merges the file over the defaults, so the rest come back unchanged.
+        """
+        merged = dict(self._raw_settings)
+        for category, options in settings.items():
+            defaults = _DEFAULT_SETTINGS.get(category, {})
+            saved_options = merged.get(category)
+            changed = dict(saved_options) if isinstance(saved_options, dict) else {}
+            for key, value in options.items():
+                if key in defaults and defaults[key] == value:
+                    changed.pop(key, None)
+                else:
+                    changed[key] = value
+            if changed:
+                merged[category] = changed
+            else:
+                merged.pop(category, None)
+        return json.dumps(merged, indent=2)
+    
     def _save_settings(self):
-        """Save settings to file"""
-        settings_file = Path.home() / "TutorialMaker" / "settings.json"
-        settings_file.parent.mkdir(exist_ok=True)
-        
+        """Save settings to file, skipping the write when nothing changed"""
+        tmp_file = _SETTINGS_FILE.with_suffix('.json.tmp')
         try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            # Serialize before touching the disk, so a bad value leaves the file as it was
+            payload = self._settings_payload(self.settings)
+            if payload == self._saved_payload:
+                return True
+            
+            _SETTINGS_FILE.parent.mkdir(exist_ok=True)
+            # Write a sibling temp file and swap it in, so a crash mid-write never
+            # leaves a truncated settings.json. No fsync: losing the last Apply on
+            # power failure is acceptable for preferences.
+            tmp_file.write_text(payload)
+            os.replace(tmp_file, _SETTINGS_FILE)
+            self._saved_payload = payload
             return True
         except Exception as e:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             messagebox.showerror("Error", f"Failed to save settings: {e}")
             return False
     
@@ -96,6 +189,8 @@ class SettingsDialog:
         self.dialog.minsize(600, 650)    # Set minimum size to prevent buttons from being cut off
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
+        # Closing from the title bar hides the dialog like Cancel does
+        self.dialog.protocol("WM_DELETE_WINDOW", self._cancel)
         
         # Center on parent
         self.dialog.geometry("+{}+{}".format(
@@ -104,7 +199,6 @@ class SettingsDialog:
         ))
         
         self._create_widgets()
-        self._load_values()
     
     def _create_widgets(self):
         """Create dialog widgets"""
@@ -112,21 +206,28 @@ class SettingsDialog:
         main_frame = ttk.Frame(self.dialog, padding="20")
         main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # Notebook for different categories
+        # Notebook for different categories; each tab starts as an empty frame
+        # and is only filled in the first time it is selected
         notebook = ttk.Notebook(main_frame)
         notebook.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
         
-        # Recording settings tab
-        self._create_recording_tab(notebook)
-        
-        # UI settings tab
-        self._create_ui_tab(notebook)
-        
-        # Hotkeys tab
-        self._create_hotkeys_tab(notebook)
-        
-        # Storage tab
-        self._create_storage_tab(notebook)
+        # tab frame path -> (frame, builder, settings category)
+        self._tabs = {}
+        self._built_tabs = []
+        # Created with the Storage tab
+        self._stats_label = None
+        for text, builder, category in (
+            ("Recording", self._create_recording_tab, 'recording'),
+            ("Interface", self._create_ui_tab, 'ui'),
+            ("Hotkeys", self._create_hotkeys_tab, 'hotkeys'),
+            ("Storage", self._create_storage_tab, 'storage'),
+        ):
+            frame = ttk.Frame(notebook, padding="15")
+            notebook.add(frame, text=text)
+            self._tabs[str(frame)] = (frame, builder, category)
+        
+        notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_tab(notebook.select())
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
@@ -143,12 +244,27 @@ class SettingsDialog:
         
         ttk.Button(button_frame, text="OK", 
                   command=self._ok).pack(side=tk.RIGHT, padx=(5, 0))
+        
+        # Inline confirmation for Apply; a modal box would block until dismissed
+        self._status_label = ttk.Label(button_frame, text="", foreground='green')
+        self._status_label.pack(side=tk.LEFT, padx=(10, 0))
+    
+    def _on_tab_changed(self, event):
+        """Build a tab the first time it is selected"""
+        self._build_tab(event.widget.select())
     
-    def _create_recording_tab(self, notebook: ttk.Notebook):
+    def _build_tab(self, tab_id):
+        """Create a tab's widgets and load its values, once"""
+        tab_id = str(tab_id)  # Notebook.select() may hand back a Tcl object
+        if tab_id not in self._tabs or tab_id in self._built_tabs:
+            return
+        frame, builder, category = self._tabs[tab_id]
+        builder(frame)
+        self._load_category_values(category)
+        self._built_tabs.append(tab_id)
+    
+    def _create_recording_tab(self, frame: ttk.Frame):
         """Create recording settings tab"""
-        frame = ttk.Frame(notebook, padding="15")
-        notebook.add(frame, text="Recording")
-        
         # Export settings
         export_frame = ttk.LabelFrame(frame, text="Export Settings", padding="10")
         export_frame.pack(fill=tk.X, pady=(0, 15))
@@ -219,11 +335,8 @@ class SettingsDialog:
                  width=5).pack(side=tk.LEFT)
         ttk.Label(timeout_frame, text="seconds").pack(side=tk.LEFT, padx=(5, 0))
     
-    def _create_ui_tab(self, notebook: ttk.Notebook):
+    def _create_ui_tab(self, frame: ttk.Frame):
         """Create UI settings tab"""
-        frame = ttk.Frame(notebook, padding="15")
-        notebook.add(frame, text="Interface")
-        
         # Window behavior
         window_frame = ttk.LabelFrame(frame, text="Window Behavior", padding="10")
         window_frame.pack(fill=tk.X, pady=(0, 15))
@@ -248,54 +361,33 @@ class SettingsDialog:
         ttk.Checkbutton(controls_frame, text="Keep controls always on top", 
                        variable=self.vars['always_on_top']).pack(anchor=tk.W, pady=(5, 0))
     
-    def _create_hotkeys_tab(self, notebook: ttk.Notebook):
+    def _create_hotkeys_tab(self, frame: ttk.Frame):
         """Create hotkeys settings tab"""
-        frame = ttk.Frame(notebook, padding="15")
-        notebook.add(frame, text="Hotkeys")
-        
         # Hotkey settings
         hotkeys_frame = ttk.LabelFrame(frame, text="Global Hotkeys", padding="10")
         hotkeys_frame.pack(fill=tk.X, pady=(0, 15))
         
-        # Start/Stop recording
-        row1 = ttk.Frame(hotkeys_frame)
-        row1.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(row1, text="Start/Stop Recording:", width=20).pack(side=tk.LEFT)
-        self.vars['start_stop_recording'] = tk.StringVar()
-        ttk.Entry(row1, textvariable=self.vars['start_stop_recording'], width=20).pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Pause/Resume
-        row2 = ttk.Frame(hotkeys_frame)
-        row2.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(row2, text="Pause/Resume:", width=20).pack(side=tk.LEFT)
-        self.vars['pause_resume'] = tk.StringVar()
-        ttk.Entry(row2, textvariable=self.vars['pause_resume'], width=20).pack(side=tk.LEFT, padx=(10, 0))
-        
-        # New tutorial
-        row3 = ttk.Frame(hotkeys_frame)
-        row3.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(row3, text="New Tutorial:", width=20).pack(side=tk.LEFT)
-        self.vars['new_tutorial'] = tk.StringVar()
-        ttk.Entry(row3, textvariable=self.vars['new_tutorial'], width=20).pack(side=tk.LEFT, padx=(10, 0))
-        
-        # Toggle floating window
-        row4 = ttk.Frame(hotkeys_frame)
-        row4.pack(fill=tk.X, pady=(0, 10))
-        ttk.Label(row4, text="Hide/Show Controls:", width=20).pack(side=tk.LEFT)
-        self.vars['toggle_floating_window'] = tk.StringVar()
-        ttk.Entry(row4, textvariable=self.vars['toggle_floating_window'], width=20).pack(side=tk.LEFT, padx=(10, 0))
+        # One label/entry grid for all rows, rather than a Frame per row
+        hotkey_rows = (
+            ("Start/Stop Recording:", 'start_stop_recording'),
+            ("Pause/Resume:", 'pause_resume'),
+            ("New Tutorial:", 'new_tutorial'),
+            ("Hide/Show Controls:", 'toggle_floating_window'),
+        )
+        for row, (label, var_name) in enumerate(hotkey_rows):
+            ttk.Label(hotkeys_frame, text=label, width=20).grid(row=row, column=0, sticky=tk.W, pady=(0, 10))
+            self.vars[var_name] = tk.StringVar()
+            ttk.Entry(hotkeys_frame, textvariable=self.vars[var_name], width=20).grid(
+                row=row, column=1, sticky=tk.W, padx=(10, 0), pady=(0, 10))
         
         # Help text
         help_text = ttk.Label(hotkeys_frame, 
                              text="Format: ctrl+shift+r, ctrl+alt+s, etc.\\nLeave empty to disable hotkey.\\nUse 'ctrl' on Windows/Linux, 'cmd' on Mac.\\nDefaults: R=Record, P=Pause, N=New, H=Hide/Show Controls",
                              foreground='gray', font=('Helvetica', 9))
-        help_text.pack(anchor=tk.W, pady=(10, 0))
+        help_text.grid(row=len(hotkey_rows), column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
     
-    def _create_storage_tab(self, notebook: ttk.Notebook):
+    def _create_storage_tab(self, frame: ttk.Frame):
         """Create storage settings tab"""
-        frame = ttk.Frame(notebook, padding="15")
-        notebook.add(frame, text="Storage")
-        
         # Storage location
         location_frame = ttk.LabelFrame(frame, text="Storage Location", padding="10")
         location_frame.pack(fill=tk.X, pady=(0, 15))
@@ -335,124 +427,116 @@ class SettingsDialog:
         info_frame = ttk.LabelFrame(frame, text="Current Usage", padding="10")
         info_frame.pack(fill=tk.X)
         
+        self._stats_label = ttk.Label(info_frame, text="")
+        self._stats_label.pack(anchor=tk.W)
+        self._refresh_stats()
+    
+    def _refresh_stats(self):
+        """Show current storage usage in the Storage tab"""
+        # Sizing the store walks every tutorial file, so do it off the Tk thread,
+        # and not at all if another dialog did it moments ago
+        cached = SettingsDialog._stats_cache
+        if cached is not None and time.monotonic() - cached[1] < self.STATS_TTL:
+            self._stats_label.config(text=self._format_stats(cached[0]))
+            return
+        
+        self._stats_label.config(text="Calculating storage usage...")
+        threading.Thread(target=self._stats_worker, daemon=True).start()
+    
+    @staticmethod
+    def _format_stats(stats: Dict[str, Any]) -> str:
+        """Usage text for the Storage tab"""
+        return f"Tutorials: {stats['total_tutorials']}\\nStorage used: {stats['total_size_mb']} MB"
+    
+    def _stats_worker(self):
+        """Collect storage statistics (worker thread)"""
         try:
             stats = self.app.storage.get_storage_stats()
-            info_text = f"Tutorials: {stats['total_tutorials']}\\nStorage used: {stats['total_size_mb']} MB"
-        except:
+            info_text = self._format_stats(stats)
+            SettingsDialog._stats_cache = (stats, time.monotonic())
+        except Exception as e:
+            self.logger.warning(f"Storage stats unavailable: {e!r}")
             info_text = "Storage information unavailable"
         
-        ttk.Label(info_frame, text=info_text).pack(anchor=tk.W)
+        try:
+            self.dialog.after(0, self._on_stats_loaded, info_text)
+        except (RuntimeError, tk.TclError):
+            pass  # Dialog closed before the walk finished
+    
+    def _on_stats_loaded(self, info_text: str):
+        """Show storage statistics once the worker is done (Tk thread)"""
+        if self._stats_label.winfo_exists():
+            self._stats_label.config(text=info_text)
     
     def _browse_storage_path(self):
         """Browse for storage path"""
+        from tkinter import filedialog
         current_path = self.vars['base_path'].get()
         new_path = filedialog.askdirectory(initialdir=current_path, title="Select storage folder")
         if new_path:
             self.vars['base_path'].set(new_path)
     
     def _load_values(self):
-        """Load current settings into UI"""
-        # Recording settings
-        recording = self.settings['recording']
-        self.vars['auto_export'].set(recording.get('auto_export', False))
-        self.vars['debug_mode'].set(recording.get('debug_mode', False))
-        self.vars['pause_on_inactivity'].set(recording.get('pause_on_inactivity', False))
-        self.vars['inactivity_timeout'].set(str(recording.get('inactivity_timeout', 30)))
-        
-        # Export formats
-        formats = recording.get('export_formats', ['html'])
-        self.vars['export_html'].set('html' in formats)
-        self.vars['export_word'].set('word' in formats)
-        self.vars['export_pdf'].set('pdf' in formats)
-        
-        # UI settings
-        ui = self.settings['ui']
-        self.vars['start_minimized'].set(ui.get('start_minimized', False))
-        self.vars['show_notifications'].set(ui.get('show_notifications', True))
-        self.vars['floating_controls'].set(ui.get('floating_controls', True))
-        self.vars['always_on_top'].set(ui.get('always_on_top', True))
-        
-        # Hotkeys
-        hotkeys = self.settings['hotkeys']
-        self.vars['start_stop_recording'].set(hotkeys.get('start_stop_recording', 'ctrl+shift+r'))
-        self.vars['pause_resume'].set(hotkeys.get('pause_resume', 'ctrl+shift+p'))
-        self.vars['new_tutorial'].set(hotkeys.get('new_tutorial', 'ctrl+shift+n'))
-        self.vars['toggle_floating_window'].set(hotkeys.get('toggle_floating_window', 'ctrl+shift+h'))
-        
-        # Storage
-        storage = self.settings['storage']
-        self.vars['base_path'].set(storage.get('base_path', str(Path.home() / "TutorialMaker")))
-        self.vars['auto_cleanup_days'].set(str(storage.get('auto_cleanup_days', 30)))
-        self.vars['max_storage_gb'].set(str(storage.get('max_storage_gb', 5.0)))
+        """Load current settings into the tabs built so far"""
+        for tab_id in self._built_tabs:
+            self._load_category_values(self._tabs[tab_id][2])
     
     def _save_values(self):
-        """Save UI values to settings"""
-        # Recording settings
-        recording = self.settings['recording']
-        recording['auto_export'] = self.vars['auto_export'].get()
-        recording['debug_mode'] = self.vars['debug_mode'].get()
-        recording['pause_on_inactivity'] = self.vars['pause_on_inactivity'].get()
-        
-        try:
-            recording['inactivity_timeout'] = int(self.vars['inactivity_timeout'].get())
-        except ValueError:
-            recording['inactivity_timeout'] = 30
-        
-        # Export formats
-        formats = []
-        if self.vars['export_html'].get():
-            formats.append('html')
-        if self.vars['export_word'].get():
-            formats.append('word')
-        if self.vars['export_pdf'].get():
-            formats.append('pdf')
-        recording['export_formats'] = formats
+        """Save UI values to settings
         
-        # Monitor selection
+        Tabs never opened have no widgets; their settings are left as loaded.
+        """
+        for tab_id in self._built_tabs:
+            self._save_category_values(self._tabs[tab_id][2])
+    
+    def _load_category_values(self, category: str):
+        """Load one settings category into its tab's variables"""
+        values = self.settings[category]
+        defaults = _DEFAULT_SETTINGS[category]
+        for key, kind in _FIELDS[category]:
+            value = values.get(key, defaults[key])
+            self.vars[key].set(value if kind is bool else str(value))
+        
+        if category == 'recording':
+            formats = values.get('export_formats', defaults['export_formats'])
+            for fmt in _EXPORT_FORMATS:
+                self.vars[f'export_{fmt}'].set(fmt in formats)
+            self._select_default_monitor()
+    
+    def _save_category_values(self, category: str):
+        """Save one tab's variables into its settings category"""
+        values = self.settings[category]
+        defaults = _DEFAULT_SETTINGS[category]
+        for key, kind in _FIELDS[category]:
+            value = self.vars[key].get()
+            if kind is int or kind is float:
+                try:
+                    value = kind(value)
+                except ValueError:
+                    value = defaults[key]
+            values[key] = value
+        
+        if category == 'recording':
+            values['export_formats'] = [fmt for fmt in _EXPORT_FORMATS
+                                        if self.vars[f'export_{fmt}'].get()]
+            values['default_monitor'] = self._selected_monitor()
+    
+    def _selected_monitor(self):
+        """Monitor number picked in the combobox, or None for auto-select"""
         monitor_selection = self.vars['default_monitor'].get()
         if monitor_selection.startswith("Auto-select"):
-            recording['default_monitor'] = None
-        else:
-            # Extract monitor number from selection like "Monitor 2: Name (1920x1080)"
-            try:
-                monitor_num = int(monitor_selection.split(":")[0].replace("Monitor ", ""))
-                recording['default_monitor'] = monitor_num
-            except (ValueError, IndexError):
-                recording['default_monitor'] = None
-        
-        # UI settings
-        ui = self.settings['ui']
-        ui['start_minimized'] = self.vars['start_minimized'].get()
-        ui['show_notifications'] = self.vars['show_notifications'].get()
-        ui['floating_controls'] = self.vars['floating_controls'].get()
-        ui['always_on_top'] = self.vars['always_on_top'].get()
-        
-        # Hotkeys
-        hotkeys = self.settings['hotkeys']
-        hotkeys['start_stop_recording'] = self.vars['start_stop_recording'].get()
-        hotkeys['pause_resume'] = self.vars['pause_resume'].get()
-        hotkeys['new_tutorial'] = self.vars['new_tutorial'].get()
-        hotkeys['toggle_floating_window'] = self.vars['toggle_floating_window'].get()
-        
-        # Storage
-        storage = self.settings['storage']
-        storage['base_path'] = self.vars['base_path'].get()
-        
+            return None
+        # Extract monitor number from selection like "Monitor 2: Name (1920x1080)"
         try:
-            storage['auto_cleanup_days'] = int(self.vars['auto_cleanup_days'].get())
-        except ValueError:
-            storage['auto_cleanup_days'] = 30
-        
-        try:
-            storage['max_storage_gb'] = float(self.vars['max_storage_gb'].get())
-        except ValueError:
-            storage['max_storage_gb'] = 5.0
+            return int(monitor_selection.split(":")[0].replace("Monitor ", ""))
+        except (ValueError, IndexError):
+            return None
     
     def _restore_defaults(self):
         """Restore default settings"""
         if messagebox.askyesno("Restore Defaults", 
                               "Are you sure you want to restore all settings to their default values?"):
-            self.settings = self._load_settings()  # This loads defaults
+            self.settings = copy.deepcopy(_DEFAULT_SETTINGS)
             self._load_values()
     
     def _apply(self):
@@ -461,7 +545,19 @@ class SettingsDialog:
         if self._save_settings():
             # Apply settings to running app
             self._apply_to_app()
-            messagebox.showinfo("Settings", "Settings applied successfully")
+            self._show_status("Settings applied")
+    
+    def _show_status(self, text: str):
+        """Show a short-lived message next to the buttons"""
+        if self._status_timer:
+            self.dialog.after_cancel(self._status_timer)
+        self._status_label.config(text=text)
+        self._status_timer = self.dialog.after(self.STATUS_CLEAR_MS, self._clear_status)
+    
+    def _clear_status(self):
+        """Clear the inline status message"""
+        self._status_timer = None
+        self._status_label.config(text="")
     
     def _apply_to_app(self):
         """Apply settings to the running application"""
@@ -498,32 +594,52 @@ class SettingsDialog:
                 primary_text = " (Primary)" if is_primary else ""
                 options.append(f"Monitor {i}: {name} ({width}x{height}){primary_text}")
             
-            self.monitor_combo['values'] = options
-            
-            # Set current selection
-            current_monitor = self.settings['recording'].get('default_monitor')
-            if current_monitor is None:
-                self.vars['default_monitor'].set(options[0])  # Auto-select
-            elif isinstance(current_monitor, int) and 1 <= current_monitor <= len(monitors):
-                self.vars['default_monitor'].set(options[current_monitor])  # Specific monitor
-            else:
-                self.vars['default_monitor'].set(options[0])  # Fallback to auto-select
-                
         except Exception as e:
             print(f"Error refreshing monitors: {e}")
             # Fallback options
-            self.monitor_combo['values'] = ["Auto-select (show dialog for multiple monitors)", "Monitor 1: Primary"]
-            self.vars['default_monitor'].set("Auto-select (show dialog for multiple monitors)")
+            options = ["Auto-select (show dialog for multiple monitors)", "Monitor 1: Primary"]
+        
+        self._monitor_options = options
+        self.monitor_combo['values'] = options
+        self._select_default_monitor()
+    
+    def _select_default_monitor(self):
+        """Point the monitor combobox at the saved default"""
+        options = self._monitor_options
+        current_monitor = self.settings['recording'].get('default_monitor')
+        if isinstance(current_monitor, int) and 1 <= current_monitor < len(options):
+            self.vars['default_monitor'].set(options[current_monitor])  # Specific monitor
+        else:
+            self.vars['default_monitor'].set(options[0])  # Auto-select
     
     def _close(self):
         """Close dialog"""
         if self.dialog:
-            self.dialog.destroy()
+            if self._status_timer:
+                self.dialog.after_cancel(self._status_timer)
+                self._clear_status()
+            # Kept for the next show(); only hidden
+            self.dialog.grab_release()
+            self.dialog.withdraw()
     
     def show(self):
-        """Show the settings dialog"""
+        """Show the settings dialog
+        
+        The window is built once and reused: closing only withdraws it. Each
+        later show() re-reads settings.json, dropping edits that were never
+        applied, and refreshes the widgets of tabs already built.
+        """
+        if self.dialog is not None and not self.dialog.winfo_exists():
+            self.dialog = None  # Destroyed with its parent; build a new one
+        
         if not self.dialog:
             self._create_dialog()
+        else:
+            self.settings = self._load_settings()
+            self._load_values()
+            if self._stats_label is not None:
+                self._refresh_stats()
+            self.dialog.deiconify()
+            self.dialog.grab_set()
         
-        self.dialog.focus_set()
-        self.dialog.wait_window()
\ No newline at end of file
+        self.dialog.focus_set()
\ No newline at end of file
@@ -41,12 +41,16 @@ class SystemTrayManager:
         if not PYSTRAY_AVAILABLE:
             return
         
-        # Create a simple icon programmatically
-        icon_image = self._create_icon_image()
+        # Create a simple icon programmatically; there are only two states, so
+        # both images are drawn once here and swapped on state changes
+        self._icon_images = {
+            False: self._create_icon_image(recording=False),
+            True: self._create_icon_image(recording=True),
+        }
         
         self.icon = pystray.Icon(
             "TutorialMaker",
-            icon_image,
+            self._icon_images[False],
             "TutorialMaker - Screen Recording Made Easy"
         )
     
@@ -291,8 +295,10 @@ Created with ❤️ for documentation and training teams."""
         if not PYSTRAY_AVAILABLE or not self.icon:
             return
         
-        new_image = self._create_icon_image(recording)
-        self.icon.icon = new_image
+        new_image = self._icon_images[recording]
+        # Assigning makes pystray rebuild the platform icon, so skip no-op updates
+        if self.icon.icon is not new_image:
+            self.icon.icon = new_image
     
     def _show_notification(self, title: str, message: str):
         """Show system notification"""
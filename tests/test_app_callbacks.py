@@ -0,0 +1,86 @@
+"""
+Unit tests for TutorialMakerApp step-count and UI callbacks
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from src.core.app import TutorialMakerApp
+
+
+def make_app():
+    """Build an app with only the callback plumbing, skipping capture and storage setup"""
+    app = TutorialMakerApp.__new__(TutorialMakerApp)
+    app.logger = Mock()
+    app.ui_callbacks = []
+    app.step_callbacks = []
+    app.session_manager = Mock()
+    app.session_manager.increment_step_counter.side_effect = [1, 2, 3]
+    return app
+
+
+class TestStepCallbacks:
+    """Test TutorialMakerApp step callback registration and delivery"""
+
+    def test_step_subscribers_receive_count(self):
+        """Test that each step callback gets the new step count"""
+        app = make_app()
+        counts = []
+        app.register_step_callback(counts.append)
+
+        assert app._increment_step() == 1
+        assert app._increment_step() == 2
+
+        assert counts == [1, 2]
+
+        print("SUCCESS: Step callbacks received step counts")
+
+    def test_ui_callbacks_not_notified_per_step(self):
+        """Test that general UI callbacks and session status are skipped on steps"""
+        app = make_app()
+        ui_callback = Mock()
+        app.register_ui_callback(ui_callback)
+        app.get_current_session_status = Mock(return_value={})
+        app.register_step_callback(Mock())
+
+        app._increment_step()
+
+        ui_callback.assert_not_called()
+        app.get_current_session_status.assert_not_called()
+
+        print("SUCCESS: UI callbacks untouched by step updates")
+
+    def test_unregister_stops_delivery(self):
+        """Test that an unregistered step callback is no longer called"""
+        app = make_app()
+        counts = []
+        app.register_step_callback(counts.append)
+        app._increment_step()
+
+        app.unregister_step_callback(counts.append)
+        app._increment_step()
+
+        assert counts == [1]
+        assert app.step_callbacks == []
+
+        print("SUCCESS: Unregistered step callback not called")
+
+    def test_failing_callback_does_not_block_others(self):
+        """Test that one raising step callback does not stop delivery to the rest"""
+        app = make_app()
+        counts = []
+        app.register_step_callback(Mock(side_effect=RuntimeError("boom")))
+        app.register_step_callback(counts.append)
+
+        assert app._increment_step() == 1
+
+        assert counts == [1]
+        app.logger.warning.assert_called_once()
+
+        print("SUCCESS: Step callback errors isolated")
@@ -0,0 +1,266 @@
+"""
+Unit tests for SettingsDialog persistence (no Tk window is created)
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from src.gui import settings_dialog
+from src.gui.settings_dialog import SettingsDialog
+
+
+@pytest.fixture
+def settings_file(tmp_path, monkeypatch):
+    """Point the dialog at a settings.json under tmp_path"""
+    path = tmp_path / "TutorialMaker" / "settings.json"
+    monkeypatch.setattr(settings_dialog, '_SETTINGS_FILE', path)
+    return path
+
+
+def write_settings(path: Path, data: dict):
+    """Write a settings.json the way a previous session would have"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2))
+
+
+class TestSettingsPayload:
+    """Test SettingsDialog._settings_payload"""
+
+    def test_only_non_default_values_written(self, settings_file):
+        """Test that values equal to the defaults are left out"""
+        dialog = SettingsDialog(None, None)
+        dialog.settings['ui']['start_minimized'] = True
+        dialog.settings['recording']['inactivity_timeout'] = 45
+
+        payload = json.loads(dialog._settings_payload(dialog.settings))
+
+        assert payload == {'recording': {'inactivity_timeout': 45},
+                           'ui': {'start_minimized': True}}
+
+        print("SUCCESS: Only changed settings serialized")
+
+    def test_defaults_serialize_to_empty(self, settings_file):
+        """Test that untouched settings produce an empty document"""
+        dialog = SettingsDialog(None, None)
+
+        assert json.loads(dialog._settings_payload(dialog.settings)) == {}
+
+        print("SUCCESS: Default settings serialize to nothing")
+
+    def test_unknown_keys_preserved(self, settings_file):
+        """Test that keys this dialog does not know survive a rewrite"""
+        write_settings(settings_file, {
+            'plugins': {'enabled': ['spellcheck']},
+            'ui': {'theme': 'dark', 'start_minimized': True},
+        })
+        dialog = SettingsDialog(None, None)
+        dialog.settings['ui']['start_minimized'] = False
+
+        payload = json.loads(dialog._settings_payload(dialog.settings))
+
+        assert payload == {'plugins': {'enabled': ['spellcheck']},
+                           'ui': {'theme': 'dark'}}
+
+        print("SUCCESS: Unknown settings keys preserved")
+
+
+class TestSaveSettings:
+    """Test SettingsDialog._save_settings"""
+
+    def test_save_writes_payload(self, settings_file):
+        """Test that a changed setting lands in settings.json via the temp file"""
+        dialog = SettingsDialog(None, None)
+        dialog.settings['hotkeys']['pause_resume'] = 'ctrl+alt+p'
+
+        assert dialog._save_settings() is True
+
+        assert json.loads(settings_file.read_text()) == {'hotkeys': {'pause_resume': 'ctrl+alt+p'}}
+        assert not settings_file.with_suffix('.json.tmp').exists()
+
+        print("SUCCESS: Settings saved through temp file")
+
+    def test_unchanged_settings_skip_write(self, settings_file):
+        """Test that saving settings identical to the file does not create it"""
+        dialog = SettingsDialog(None, None)
+        dialog._saved_payload = dialog._settings_payload(dialog.settings)
+
+        assert dialog._save_settings() is True
+        assert not settings_file.exists()
+
+        print("SUCCESS: Unchanged settings not written")
+
+    def test_saved_settings_reload(self, settings_file):
+        """Test that a new dialog sees what the previous one saved"""
+        dialog = SettingsDialog(None, None)
+        dialog.settings['storage']['max_storage_gb'] = 2.5
+        dialog._save_settings()
+
+        reloaded = SettingsDialog(None, None)
+
+        assert reloaded.settings['storage']['max_storage_gb'] == 2.5
+        assert reloaded._saved_payload == dialog._saved_payload
+
+        print("SUCCESS: Saved settings reloaded")
+
+
+class TestLoadSettings:
+    """Test SettingsDialog._load_settings merging over the defaults"""
+
+    def test_missing_file_gives_defaults(self, settings_file):
+        """Test that no settings.json means plain defaults and nothing on disk"""
+        dialog = SettingsDialog(None, None)
+
+        assert dialog.settings == settings_dialog._DEFAULT_SETTINGS
+        assert dialog.settings is not settings_dialog._DEFAULT_SETTINGS
+        assert dialog._raw_settings == {}
+        assert dialog._saved_payload is None
+
+        print("SUCCESS: Missing settings file falls back to defaults")
+
+    def test_invalid_json_gives_defaults(self, settings_file, capsys):
+        """Test that a corrupt settings.json is reported and ignored"""
+        settings_file.parent.mkdir(parents=True)
+        settings_file.write_text('{"ui": {"start_minimized": tru')
+
+        dialog = SettingsDialog(None, None)
+
+        assert dialog.settings == settings_dialog._DEFAULT_SETTINGS
+        assert dialog._raw_settings == {}
+        assert dialog._saved_payload is None
+        assert "Error loading settings" in capsys.readouterr().out
+
+        print("SUCCESS: Invalid settings file falls back to defaults")
+
+    def test_partial_file_merged_over_defaults(self, settings_file):
+        """Test that saved categories override only the keys they contain"""
+        write_settings(settings_file, {
+            'ui': {'always_on_top': False},
+            'hotkeys': 'not a category dict',
+            'plugins': {'enabled': True},
+        })
+
+        dialog = SettingsDialog(None, None)
+
+        defaults = settings_dialog._DEFAULT_SETTINGS
+        assert dialog.settings['ui'] == dict(defaults['ui'], always_on_top=False)
+        assert dialog.settings['recording'] == defaults['recording']
+        assert dialog.settings['hotkeys'] == defaults['hotkeys']
+        assert 'plugins' not in dialog.settings
+        assert defaults['ui']['always_on_top'] is True
+
+        print("SUCCESS: Partial settings merged over defaults")
+
+
+class TestAtomicSave:
+    """Test that settings.json is replaced atomically"""
+
+    def test_no_temp_file_left_behind(self, settings_file):
+        """Test that repeated saves leave only settings.json in the directory"""
+        dialog = SettingsDialog(None, None)
+        for timeout in (10, 20, 30):
+            dialog.settings['recording']['inactivity_timeout'] = timeout
+            assert dialog._save_settings() is True
+
+        assert [p.name for p in settings_file.parent.iterdir()] == ['settings.json']
+
+        print("SUCCESS: No temp file left after saving")
+
+    def test_failed_serialization_keeps_existing_file(self, settings_file, monkeypatch):
+        """Test that an unserializable value reports an error and leaves the file alone"""
+        write_settings(settings_file, {'ui': {'start_minimized': True}})
+        original = settings_file.read_text()
+        errors = []
+        monkeypatch.setattr(settings_dialog.messagebox, 'showerror',
+                            lambda title, message: errors.append(message))
+
+        dialog = SettingsDialog(None, None)
+        dialog.settings['ui']['start_minimized'] = object()
+
+        assert dialog._save_settings() is False
+        assert len(errors) == 1
+        assert settings_file.read_text() == original
+        assert not settings_file.with_suffix('.json.tmp').exists()
+
+        print("SUCCESS: Existing settings survive a failed save")
+
+    def test_failed_replace_removes_temp_file(self, settings_file, monkeypatch):
+        """Test that a failed swap keeps the old file and cleans up the temp file"""
+        write_settings(settings_file, {'ui': {'start_minimized': True}})
+        original = settings_file.read_text()
+        monkeypatch.setattr(settings_dialog.messagebox, 'showerror', lambda title, message: None)
+
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+        monkeypatch.setattr(settings_dialog.os, 'replace', failing_replace)
+
+        dialog = SettingsDialog(None, None)
+        dialog.settings['ui']['start_minimized'] = False
+
+        assert dialog._save_settings() is False
+        assert settings_file.read_text() == original
+        assert not settings_file.with_suffix('.json.tmp').exists()
+
+        print("SUCCESS: Temp file removed after a failed swap")
+
+
+class TestSkipUnchangedSave:
+    """Test that saving without edits does not touch the disk"""
+
+    @pytest.fixture
+    def replace_calls(self, monkeypatch):
+        """Record every os.replace the dialog makes while still performing it"""
+        calls = []
+        real_replace = settings_dialog.os.replace
+
+        def counting_replace(src, dst):
+            calls.append((Path(src).name, Path(dst).name))
+            real_replace(src, dst)
+        monkeypatch.setattr(settings_dialog.os, 'replace', counting_replace)
+        return calls
+
+    def test_second_save_without_edits_skipped(self, settings_file, replace_calls):
+        """Test that two saves with no edit in between write once"""
+        dialog = SettingsDialog(None, None)
+        dialog.settings['ui']['show_notifications'] = False
+
+        assert dialog._save_settings() is True
+        assert dialog._save_settings() is True
+
+        assert replace_calls == [('settings.json.tmp', 'settings.json')]
+
+        print("SUCCESS: Unchanged second save skipped")
+
+    def test_reopened_dialog_save_skipped(self, settings_file, replace_calls):
+        """Test that saving right after loading an existing file writes nothing"""
+        write_settings(settings_file, {'ui': {'show_notifications': False},
+                                       'plugins': {'enabled': True}})
+
+        dialog = SettingsDialog(None, None)
+
+        assert dialog._save_settings() is True
+        assert replace_calls == []
+
+        print("SUCCESS: Save after load skipped")
+
+    def test_edit_after_save_written(self, settings_file, replace_calls):
+        """Test that an edit after a skipped save is still written"""
+        dialog = SettingsDialog(None, None)
+        dialog.settings['ui']['show_notifications'] = False
+        dialog._save_settings()
+        dialog._save_settings()
+
+        dialog.settings['ui']['show_notifications'] = True
+        dialog._save_settings()
+
+        assert len(replace_calls) == 2
+        assert json.loads(settings_file.read_text()) == {}
+
+        print("SUCCESS: Edit after skipped save written")
@@ -0,0 +1,120 @@
+"""
+Unit tests for TutorialStorage bulk operations and tutorial listing
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from src.core.storage import TutorialStorage
+
+
+class TestDeleteTutorials:
+    """Test TutorialStorage.delete_tutorials"""
+    
+    def test_deletes_only_requested_tutorials(self, tmp_path):
+        """Test that only the given tutorials are removed"""
+        storage = TutorialStorage(base_path=tmp_path)
+        keep_id = storage.create_tutorial_project("Keep")
+        delete_ids = [storage.create_tutorial_project(f"Delete {i}") for i in range(3)]
+        
+        results = storage.delete_tutorials(delete_ids)
+        
+        assert results == {tutorial_id: True for tutorial_id in delete_ids}
+        remaining = [t.tutorial_id for t in storage.list_tutorials()]
+        assert remaining == [keep_id]
+        
+        print("SUCCESS: Bulk delete removed only the requested tutorials")
+    
+    def test_unknown_tutorial_reported_as_failure(self, tmp_path):
+        """Test that missing tutorials are reported instead of raising"""
+        storage = TutorialStorage(base_path=tmp_path)
+        tutorial_id = storage.create_tutorial_project("Existing")
+        
+        results = storage.delete_tutorials([tutorial_id, "00000000-missing"])
+        
+        assert results == {tutorial_id: True, "00000000-missing": False}
+        
+        print("SUCCESS: Missing tutorial reported as failed delete")
+    
+    def test_progress_callback(self, tmp_path):
+        """Test that progress is reported after every tutorial"""
+        storage = TutorialStorage(base_path=tmp_path)
+        tutorial_ids = [storage.create_tutorial_project(f"T{i}") for i in range(3)]
+        progress = []
+        
+        storage.delete_all_tutorials(progress_callback=lambda done, total: progress.append((done, total)))
+        
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert storage.list_tutorials() == []
+        
+        print("SUCCESS: Progress reported for each deleted tutorial")
+
+
+class TestListTutorials:
+    """Test TutorialStorage.list_tutorials metadata caching"""
+    
+    def test_unchanged_metadata_is_reused(self, tmp_path):
+        """Test that unchanged tutorials return the cached metadata object"""
+        storage = TutorialStorage(base_path=tmp_path)
+        storage.create_tutorial_project("Cached")
+        
+        first = storage.list_tutorials()
+        second = storage.list_tutorials()
+        
+        assert len(first) == 1
+        assert second[0] is first[0]
+        
+        print("SUCCESS: Unchanged metadata served from cache")
+    
+    def test_changed_metadata_is_reloaded(self, tmp_path):
+        """Test that edits to metadata.json show up on the next listing"""
+        storage = TutorialStorage(base_path=tmp_path)
+        tutorial_id = storage.create_tutorial_project("Before")
+        storage.list_tutorials()
+        
+        metadata = storage.load_tutorial_metadata(tutorial_id)
+        metadata.title = "After - renamed"
+        storage._save_metadata(storage.get_project_path(tutorial_id), metadata)
+        
+        assert [t.title for t in storage.list_tutorials()] == ["After - renamed"]
+        
+        print("SUCCESS: Edited metadata reloaded")
+    
+    def test_same_size_rewrite_within_tick_is_reloaded(self, tmp_path):
+        """Test that a save is seen even when the file's timestamps don't move"""
+        storage = TutorialStorage(base_path=tmp_path)
+        tutorial_id = storage.create_tutorial_project("Before")
+        project_path = storage.get_project_path(tutorial_id)
+        metadata_file = project_path / "metadata.json"
+        storage.list_tutorials()
+        original = metadata_file.stat()
+        
+        metadata = storage.load_tutorial_metadata(tutorial_id)
+        metadata.title = "Beford"
+        metadata.last_modified = storage.list_tutorials()[0].last_modified
+        storage._save_metadata(project_path, metadata)
+        os.utime(metadata_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+        
+        assert metadata_file.stat().st_size == original.st_size
+        assert [t.title for t in storage.list_tutorials()] == ["Beford"]
+        
+        print("SUCCESS: Same-size rewrite reloaded")
+    
+    def test_deleted_tutorial_dropped(self, tmp_path):
+        """Test that deleted tutorials disappear from the listing and the cache"""
+        storage = TutorialStorage(base_path=tmp_path)
+        tutorial_id = storage.create_tutorial_project("Gone")
+        storage.list_tutorials()
+        
+        storage.delete_tutorial(tutorial_id)
+        
+        assert storage.list_tutorials() == []
+        assert storage._metadata_cache == {}
+        
+        print("SUCCESS: Deleted tutorial dropped from listing")